@@ -5,7 +5,12 @@ Generates the same chart types as the Data Axle dashboard using fullcontact_matc
 """
 
 import argparse
+import functools
 import os
+import re
+import string
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from dotenv import load_dotenv
@@ -19,16 +24,22 @@ def _fullcontact_env(key: str, default: str) -> str:
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # headless raster backend; faster than an interactive canvas
 import matplotlib.pyplot as plt
 import seaborn as sns
 import warnings
-warnings.filterwarnings("ignore")
 
 try:
     from fullcontact_loader import load_from_postgres
 except ImportError:
     load_from_postgres = None
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 plt.style.use("seaborn-v0_8")
 sns.set_palette("husl")
 
@@ -52,46 +63,175 @@ COL = {
 }
 OUTPUT_PREFIX = "fullcontact_"
 
+# Raster settings: 150 dpi halves the pixel count vs the old 300 and light
+# zlib compression keeps PNG encoding off the critical path; override the
+# resolution with FC_DASH_DPI for print-quality runs
+_SAVEFIG_KWARGS = {
+    "dpi": int(os.environ.get("FC_DASH_DPI", "150")),
+    "pil_kwargs": {"compress_level": 1},
+}
 
-def _col(df, *candidates):
-    """Return first column that exists in df."""
-    for c in candidates:
-        if c in df.columns:
-            return c
-    return None
-
-
-def _gender_col(df):
-    return _col(df, COL["gender"], COL["details_gender"])
+# One 2x2 figure per figsize, reused across chart functions and stores so we
+# don't allocate a fresh Figure/Canvas for every render
+_FIG_CACHE = {}
 
 
-def _state_col(df):
-    return _col(df, COL["region"], "fullcontact.details.locations[0].regionCode", COL["location"])
+def _save_fig(fig, filename, suptitle_room=True):
+    """Lay out and save a chart, silencing matplotlib's layout UserWarnings
+    locally instead of muting warnings process-wide."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        fig.tight_layout()
+        if suptitle_room:
+            fig.subplots_adjust(top=0.93)  # keep room for the suptitle
+        fig.savefig(filename, **_SAVEFIG_KWARGS)
 
 
-def _city_col(df):
-    return _col(df, COL["city"])
+@functools.lru_cache(maxsize=64)
+def _viridis(n):
+    """Cached viridis color ramp for n bars."""
+    return plt.cm.viridis(np.linspace(0, 1, n))
 
 
-def normalize_numeric_columns(df):
-    """Coerce FullContact numeric columns."""
-    for col in list(df.columns):
-        if col in (COL["age"], COL["age_value"], "fullcontact.details.age", "fullcontact.details.age.value"):
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-    return df
+def get_fig(figsize):
+    """Return a cached 2x2 figure for figsize with its axes cleared for reuse."""
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None:
+        fig, _ = plt.subplots(2, 2, figsize=figsize)
+        _FIG_CACHE[figsize] = fig
+    else:
+        for ax in fig.axes:
+            ax.clear()
+            ax.set_axis_on()
+            # clear() keeps the aspect ratio, and the pie charts lock it to
+            # 1.0 — reset it so a recycled axis can draw bars full-width
+            ax.set_aspect("auto")
+    return fig, np.array(fig.axes, dtype=object).reshape(2, 2)
+
+
+def _col(df, *candidates, col_set=None):
+    """Return first column that exists in df (or in a prebuilt col_set)."""
+    cols = col_set if col_set is not None else df.columns
+    for c in candidates:
+        if c in cols:
+            return c
+    return None
 
 
-def create_geographic_analysis(df, suffix=""):
+def _gender_col(df, col_set=None):
+    return _col(df, COL["gender"], COL["details_gender"], col_set=col_set)
+
+
+def _state_col(df, col_set=None):
+    return _col(df, COL["region"], "fullcontact.details.locations[0].regionCode", COL["location"], col_set=col_set)
+
+
+def _city_col(df, col_set=None):
+    return _col(df, COL["city"], col_set=col_set)
+
+
+# Everything the chart functions actually read; other flattened FullContact
+# columns are dead weight for rendering and can be dropped before a slice is
+# pickled to a worker process
+_USED_COL_EXACT = frozenset(COL.values()) | {"fullcontact.details.locations[0].regionCode"}
+_USED_COL_SUBSTRINGS = (
+    "fullcontact.details.surveys",
+    "fullcontact.details.marketTrends",
+    "fullcontact.details.interests[",
+    "demographics.enthusiasts",
+    "enthusiasts.niches",
+    "household.finance.income",
+    "household.finance.netWorth",
+    "household.homeInfo.ownerOrRenter",
+    "household.homeInfo.maritalStatus",
+)
+
+
+def used_columns(columns):
+    """Subset of columns the dashboard renders from."""
+    return [c for c in columns if c in _USED_COL_EXACT or any(k in c for k in _USED_COL_SUBSTRINGS)]
+
+
+# One compiled alternation classifies every interest-bearing column name;
+# the named group that fires picks the bucket
+_COLUMN_BUCKET_RE = re.compile(
+    r"(?P<survey_cols>fullcontact\.details\.surveys)"
+    r"|(?P<market_cols>fullcontact\.details\.marketTrends)"
+    r"|(?P<interest_array_cols>fullcontact\.details\.interests\[[^]]*\])"
+    r"|(?P<niche_cols>demographics\.enthusiasts|enthusiasts\.niches)"
+)
+
+
+def classify_columns(columns):
+    """Bucket interest-bearing columns in a single compiled-regex pass.
+
+    Replaces the four per-call list comprehensions in
+    create_interests_analysis, each of which rescanned every column name.
+    A column that matches several alternations lands in each bucket, like
+    the old independent substring checks.
+    """
+    groups = {"survey_cols": [], "market_cols": [], "interest_array_cols": [], "niche_cols": []}
+    for c in columns:
+        for bucket in {m.lastgroup for m in _COLUMN_BUCKET_RE.finditer(c)}:
+            groups[bucket].append(c)
+    return groups
+
+
+# Low-cardinality text columns worth storing as category: value_counts then
+# runs on the small integer codes array instead of hashing Python strings
+CATEGORY_COLS = (
+    COL["gender"],
+    COL["region"],
+    COL["city"],
+    COL["income"],
+    COL["net_worth"],
+    COL["owner_renter"],
+    COL["marital_status"],
+)
+
+
+def precompute_counts(df, col_set=None):
+    """Compute state/city/gender value_counts once so the chart functions share them."""
+    counts = {}
+    for key, col in (
+        ("state", _state_col(df, col_set)),
+        ("city", _city_col(df, col_set)),
+        ("gender", _gender_col(df, col_set)),
+    ):
+        if col:
+            s = df[col]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                # Counts come straight off the codes; drop unused categories
+                vc = s.value_counts()
+                counts[key] = vc[vc > 0]
+            else:
+                counts[key] = s.dropna().astype(str).value_counts()
+    return counts
+
+
+def normalize_dtypes(df):
+    """Coerce FullContact numeric columns and cast repeated text columns to category."""
+    numeric_cols = (COL["age"], COL["age_value"], "fullcontact.details.age", "fullcontact.details.age.value")
+    coerced = {c: pd.to_numeric(df[c], errors="coerce") for c in numeric_cols if c in df.columns}
+    coerced.update({c: df[c].astype("string").astype("category") for c in CATEGORY_COLS if c in df.columns})
+    # One assign applies every cast in a single block operation instead of
+    # fragmenting the frame with per-column writes
+    return df.assign(**coerced) if coerced else df
+
+
+def create_geographic_analysis(df, suffix="", counts=None, col_set=None):
     """Create geographic distribution visualizations from FullContact location data."""
     print(f"Creating geographic analysis{suffix}...")
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    if counts is None:
+        counts = precompute_counts(df, col_set)
+    fig, axes = get_fig((16, 12))
     fig.suptitle("Geographic Distribution of Users (FullContact)", fontsize=16, fontweight="bold")
 
-    state_col = _state_col(df)
-    city_col = _city_col(df)
+    state_col = _state_col(df, col_set)
+    city_col = _city_col(df, col_set)
 
     if state_col:
-        state_counts = df[state_col].dropna().astype(str).value_counts().head(15)
+        state_counts = counts["state"].head(15)
         if len(state_counts) > 0:
             axes[0, 0].bar(range(len(state_counts)), state_counts.values)
             axes[0, 0].set_xticks(range(len(state_counts)))
@@ -103,7 +243,7 @@ def create_geographic_analysis(df, suffix=""):
         axes[0, 0].set_title("Top 15 Regions by User Count")
 
     if city_col:
-        city_counts = df[city_col].dropna().astype(str).value_counts().head(15)
+        city_counts = counts["city"].head(15)
         if len(city_counts) > 0:
             axes[0, 1].barh(range(len(city_counts)), city_counts.values)
             axes[0, 1].set_yticks(range(len(city_counts)))
@@ -115,12 +255,9 @@ def create_geographic_analysis(df, suffix=""):
         axes[0, 1].set_title("Top 15 Cities")
 
     if state_col:
-        state_data = df[state_col].dropna().astype(str).value_counts()
-        top_states = state_data.head(20)
+        top_states = counts["state"].head(20)
         if len(top_states) > 0:
-            bars = axes[1, 0].bar(
-                range(len(top_states)), top_states.values, color=plt.cm.viridis(np.linspace(0, 1, len(top_states)))
-            )
+            bars = axes[1, 0].bar(range(len(top_states)), top_states.values, color=_viridis(len(top_states)))
             axes[1, 0].set_xticks(range(len(top_states)))
             axes[1, 0].set_xticklabels(top_states.index, rotation=45)
             axes[1, 0].set_title("User Concentration by Region (Top 20)")
@@ -129,20 +266,20 @@ def create_geographic_analysis(df, suffix=""):
         axes[1, 0].axis("off")
 
     axes[1, 1].axis("off")
-    plt.tight_layout()
-    plt.savefig(f"{OUTPUT_PREFIX}geographic_analysis{suffix}.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    _save_fig(fig, f"{OUTPUT_PREFIX}geographic_analysis{suffix}.png")
 
 
-def create_demographic_analysis(df, suffix=""):
+def create_demographic_analysis(df, suffix="", counts=None, col_set=None):
     """Create demographic visualizations (gender, age, name) from FullContact."""
     print(f"Creating demographic analysis{suffix}...")
-    fig, axes = plt.subplots(2, 2, figsize=(18, 12))
+    if counts is None:
+        counts = precompute_counts(df, col_set)
+    fig, axes = get_fig((18, 12))
     fig.suptitle("User Demographics Analysis (FullContact)", fontsize=16, fontweight="bold")
 
-    gender_col = _gender_col(df)
+    gender_col = _gender_col(df, col_set)
     if gender_col:
-        gender_counts = df[gender_col].dropna().astype(str).value_counts()
+        gender_counts = counts["gender"]
         if len(gender_counts) > 0:
             axes[0, 0].pie(gender_counts.values, labels=gender_counts.index, autopct="%1.1f%%")
         axes[0, 0].set_title("Gender Distribution")
@@ -163,10 +300,23 @@ def create_demographic_analysis(df, suffix=""):
         axes[0, 1].text(0.5, 0.5, "No age data", ha="center", va="center", transform=axes[0, 1].transAxes)
         axes[0, 1].set_title("Age Distribution")
 
-    name_col = _col(df, COL["full_name"], COL["name_full"])
+    name_col = _col(df, COL["full_name"], COL["name_full"], col_set=col_set)
     if name_col:
-        has_name = df[name_col].notna() & (df[name_col].astype(str).str.strip() != "")
-        axes[1, 0].bar(["With name", "Missing name"], [has_name.sum(), (~has_name).sum()])
+        s = df[name_col]
+        has_count = None
+        if pyarrow is not None:
+            # Trim + compare inside Arrow instead of a Python-object str pass
+            try:
+                import pyarrow.compute as pc
+                arr = s.array._pa_array if hasattr(s.array, "_pa_array") else pyarrow.array(s.astype("string"))
+                trimmed = pc.utf8_trim_whitespace(arr)
+                has_count = pc.sum(pc.and_(pc.is_valid(arr), pc.not_equal(trimmed, ""))).as_py() or 0
+            except Exception:
+                has_count = None
+        if has_count is None:
+            has_name = s.notna() & (s.astype(str).str.strip() != "")
+            has_count = int(has_name.sum())
+        axes[1, 0].bar(["With name", "Missing name"], [has_count, len(s) - has_count])
         axes[1, 0].set_title("Name Coverage")
         axes[1, 0].set_ylabel("Number of Users")
     else:
@@ -174,36 +324,47 @@ def create_demographic_analysis(df, suffix=""):
         axes[1, 0].set_title("Name Coverage")
 
     axes[1, 1].axis("off")
-    plt.tight_layout()
-    plt.savefig(f"{OUTPUT_PREFIX}demographic_analysis{suffix}.png", dpi=300, bbox_inches="tight")
-    plt.close()
-
-
-def _parse_income_midpoint(s):
-    """Parse '$75,000 - $99,999' to midpoint (87500). Return None if unparseable."""
-    if pd.isna(s) or not isinstance(s, str):
-        return None
-    import re
-    nums = re.findall(r"\$?([\d,]+)", s)
-    if len(nums) >= 2:
-        try:
-            lo = int(nums[0].replace(",", ""))
-            hi = int(nums[1].replace(",", ""))
-            return (lo + hi) / 2
-        except ValueError:
-            pass
-    if len(nums) == 1:
-        try:
-            return int(nums[0].replace(",", ""))
-        except ValueError:
-            pass
-    return None
+    _save_fig(fig, f"{OUTPUT_PREFIX}demographic_analysis{suffix}.png")
+
+
+_INCOME_RE = re.compile(r"\$?([\d,]+)")
+
+
+def parse_income_midpoints(series):
+    """Vectorized income-bucket parsing: '$75,000 - $99,999' -> 87500.0 per row.
+
+    One extractall pass over the column instead of a per-row regex apply;
+    rows with no parseable number come back NaN.
+    """
+    matches = series.astype("string").str.extractall(_INCOME_RE)[0]
+    nums = pd.to_numeric(matches.str.replace(",", "", regex=False), errors="coerce").unstack()
+    if nums.empty:
+        return pd.Series(np.nan, index=series.index, dtype=float)
+    # Midpoint of the first two numbers; a lone number is its own midpoint
+    return nums.iloc[:, :2].mean(axis=1).reindex(series.index)
+
+
+def compute_stats(df, col_set=None):
+    """Overview stats shared by the summary chart and the HTML page."""
+    state_col = _state_col(df, col_set)
+    city_col = _city_col(df, col_set)
+    return {
+        "total_users": len(df),
+        "unique_states": int(df[state_col].nunique()) if state_col else 0,
+        "unique_cities": int(df[city_col].nunique()) if city_col else 0,
+    }
+
+
+def clean_cat(s):
+    """Drop NA and blank entries (stripping whitespace) ahead of value_counts."""
+    s = s.dropna().astype("string").str.strip()
+    return s[s != ""]
 
 
 def create_financial_analysis(df, suffix=""):
     """Financial profile from fullcontact.details.household.finance and homeInfo."""
     print(f"Creating financial analysis{suffix}...")
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = get_fig((16, 12))
     fig.suptitle("Financial Profile of Users (FullContact)", fontsize=16, fontweight="bold")
 
     income_col = _col(df, COL["income"]) or next((c for c in df.columns if "household.finance.income" in c), None)
@@ -213,8 +374,7 @@ def create_financial_analysis(df, suffix=""):
 
     # Income distribution (by bucket string)
     if income_col:
-        inc_counts = df[income_col].dropna().astype(str).value_counts()
-        inc_counts = inc_counts[inc_counts.index.str.strip() != ""]
+        inc_counts = clean_cat(df[income_col]).value_counts()
         if len(inc_counts) > 0:
             top_inc = inc_counts.head(12)
             axes[0, 0].barh(range(len(top_inc)), top_inc.values, color="steelblue")
@@ -222,6 +382,15 @@ def create_financial_analysis(df, suffix=""):
             axes[0, 0].set_yticklabels(top_inc.index, fontsize=8)
             axes[0, 0].set_title("Income (Household Finance)")
             axes[0, 0].set_xlabel("Number of Users")
+            # Bucket midpoints give a rough numeric summary of the labels
+            midpoints = parse_income_midpoints(df[income_col]).dropna()
+            if len(midpoints) > 0:
+                axes[0, 0].text(
+                    0.98, 0.02,
+                    f"Midpoint mean ${midpoints.mean():,.0f} | median ${midpoints.median():,.0f}",
+                    ha="right", va="bottom", transform=axes[0, 0].transAxes,
+                    fontsize=8, style="italic", color="#444",
+                )
         else:
             axes[0, 0].text(0.5, 0.5, "No income data", ha="center", va="center", transform=axes[0, 0].transAxes)
             axes[0, 0].set_title("Income")
@@ -231,8 +400,7 @@ def create_financial_analysis(df, suffix=""):
 
     # Net worth distribution
     if networth_col:
-        nw_counts = df[networth_col].dropna().astype(str).value_counts()
-        nw_counts = nw_counts[nw_counts.index.str.strip() != ""]
+        nw_counts = clean_cat(df[networth_col]).value_counts()
         if len(nw_counts) > 0:
             top_nw = nw_counts.head(12)
             axes[0, 1].barh(range(len(top_nw)), top_nw.values, color="seagreen")
@@ -249,8 +417,7 @@ def create_financial_analysis(df, suffix=""):
 
     # Home: owner vs renter
     if owner_col:
-        owner_counts = df[owner_col].dropna().astype(str).value_counts()
-        owner_counts = owner_counts[owner_counts.index.str.strip() != ""]
+        owner_counts = clean_cat(df[owner_col]).value_counts()
         if len(owner_counts) > 0:
             labels = [str(x) if x != "H" else "Owner (H)" for x in owner_counts.index]
             axes[1, 0].pie(owner_counts.values, labels=labels, autopct="%1.1f%%")
@@ -264,8 +431,7 @@ def create_financial_analysis(df, suffix=""):
 
     # Marital status (homeInfo)
     if marital_col:
-        mar_counts = df[marital_col].dropna().astype(str).value_counts()
-        mar_counts = mar_counts[mar_counts.index.str.strip() != ""]
+        mar_counts = clean_cat(df[marital_col]).value_counts()
         if len(mar_counts) > 0:
             axes[1, 1].pie(mar_counts.values, labels=mar_counts.index, autopct="%1.1f%%")
             axes[1, 1].set_title("Marital Status (Home Info)")
@@ -276,9 +442,19 @@ def create_financial_analysis(df, suffix=""):
         axes[1, 1].text(0.5, 0.5, "No marital column", ha="center", va="center", transform=axes[1, 1].transAxes)
         axes[1, 1].set_title("Marital Status")
 
-    plt.tight_layout()
-    plt.savefig(f"{OUTPUT_PREFIX}financial_analysis{suffix}.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    _save_fig(fig, f"{OUTPUT_PREFIX}financial_analysis{suffix}.png")
+
+
+def _survey_yes_counts(df, cols):
+    """Per-column count of "Y" answers across a survey-column block in one pass."""
+    arr = df[list(cols)].astype("string").fillna("").to_numpy(dtype="U")
+    return (np.char.upper(np.char.strip(arr)) == "Y").sum(axis=0)
+
+
+def _market_likely_counts(df, cols):
+    """Per-column count of Likely / Highly Likely across a market-trend block."""
+    arr = df[list(cols)].astype("string").fillna("").to_numpy(dtype="U")
+    return np.isin(np.char.strip(arr), ("Likely", "Highly Likely")).sum(axis=0)
 
 
 def _interest_label(col_name):
@@ -287,60 +463,52 @@ def _interest_label(col_name):
     return parts[-1] if parts else col_name
 
 
-def create_interests_analysis(df, suffix=""):
+def create_interests_analysis(df, suffix="", col_groups=None):
     """Interests from surveys (Y), marketTrends (Likely/Highly Likely), and details.interests[*]."""
     print(f"Creating interests analysis{suffix}...")
-    fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+    if col_groups is None:
+        col_groups = classify_columns(df.columns)
+    fig, axes = get_fig((20, 16))
     fig.suptitle("User Interests (FullContact: Surveys & Market Trends)", fontsize=16, fontweight="bold")
 
-    interest_counts = {}
-
-    # 1) Surveys: value "Y" = has interest (e.g. hobby.baking, mailOrder.apparel)
-    survey_cols = [c for c in df.columns if "fullcontact.details.surveys" in c]
-    for col in survey_cols:
-        count = (df[col].astype(str).str.strip().str.upper() == "Y").sum()
-        if count > 0:
-            label = _interest_label(col)
-            interest_counts[label] = interest_counts.get(label, 0) + count
-
-    # 2) Market trends: "Likely" or "Highly Likely" = interest (e.g. enthusiasts.football)
-    market_cols = [c for c in df.columns if "fullcontact.details.marketTrends" in c]
-    for col in market_cols:
-        count = df[col].astype(str).str.strip().isin(["Likely", "Highly Likely"]).sum()
-        if count > 0:
-            label = _interest_label(col)
-            interest_counts[label] = interest_counts.get(label, 0) + count
-
-    # 3) details.interests[*] array (string values)
-    interest_array_cols = [c for c in df.columns if "fullcontact.details.interests" in c and "[" in c and "]" in c]
-    for col in interest_array_cols:
-        vals = df[col].dropna().astype(str)
-        vals = vals[vals.str.strip() != ""]
-        for v in vals:
-            v = v.strip()
-            if v:
-                interest_counts[v] = interest_counts.get(v, 0) + 1
-
-    # 4) demographics.enthusiasts.niches (e.g. "IRA Spenders")
-    niche_cols = [c for c in df.columns if "demographics.enthusiasts" in c or "enthusiasts.niches" in c]
-    for col in niche_cols:
-        vals = df[col].dropna().astype(str)
-        vals = vals[vals.str.strip() != ""]
-        for v in vals:
-            v = v.strip()
-            if v:
-                interest_counts[v] = interest_counts.get(v, 0) + 1
+    interest_counts = Counter()
+
+    # 1) Surveys: value "Y" = has interest (e.g. hobby.baking, mailOrder.apparel).
+    # One block pass feeds both the combined ranking and the surveys-only panel.
+    survey_cols = col_groups["survey_cols"]
+    survey_only = Counter()
+    if survey_cols:
+        for col, count in zip(survey_cols, _survey_yes_counts(df, survey_cols)):
+            if count > 0:
+                survey_only[_interest_label(col)] += int(count)
+        interest_counts.update(survey_only)
+
+    # 2) Market trends: "Likely" or "Highly Likely" = interest (e.g.
+    # enthusiasts.football); again one pass shared with the trends-only panel
+    market_cols = col_groups["market_cols"]
+    market_only = Counter()
+    if market_cols:
+        for col, count in zip(market_cols, _market_likely_counts(df, market_cols)):
+            if count > 0:
+                market_only[_interest_label(col)] += int(count)
+        interest_counts.update(market_only)
+
+    # 3) details.interests[*] array and 4) demographics.enthusiasts.niches
+    # (e.g. "IRA Spenders"): count each column in C via value_counts instead
+    # of a per-row Python loop
+    for col in col_groups["interest_array_cols"] + col_groups["niche_cols"]:
+        vals = df[col].dropna().astype("string").str.strip()
+        vals = vals[vals != ""]
+        if len(vals):
+            interest_counts.update(vals.value_counts().to_dict())
 
     if not interest_counts:
         for ax in axes.flat:
             ax.text(0.5, 0.5, "No interest data in this dataset", ha="center", va="center", transform=ax.transAxes)
-        plt.tight_layout()
-        plt.savefig(f"{OUTPUT_PREFIX}interests_analysis{suffix}.png", dpi=300, bbox_inches="tight")
-        plt.close()
+        _save_fig(fig, f"{OUTPUT_PREFIX}interests_analysis{suffix}.png", suptitle_room=False)
         return
 
-    from collections import Counter
-    top_all = Counter(interest_counts).most_common(15)
+    top_all = interest_counts.most_common(15)
     labels, values = zip(*top_all) if top_all else ([], [])
 
     axes[0, 0].barh(range(len(labels)), values, color="skyblue")
@@ -350,12 +518,6 @@ def create_interests_analysis(df, suffix=""):
     axes[0, 0].set_xlabel("Number of Users")
 
     # Top market trends only (Likely/Highly Likely) – from market_cols only
-    market_only = {}
-    for col in market_cols:
-        label = _interest_label(col)
-        count = df[col].astype(str).str.strip().isin(["Likely", "Highly Likely"]).sum()
-        if count > 0:
-            market_only[label] = market_only.get(label, 0) + count
     if market_only:
         top_market = sorted(market_only.items(), key=lambda x: -x[1])[:15]
         mk_labels, mk_vals = zip(*top_market)
@@ -369,11 +531,6 @@ def create_interests_analysis(df, suffix=""):
         axes[0, 1].set_title("Market Trends")
 
     # Surveys only (Y)
-    survey_only = {}
-    for col in survey_cols:
-        count = (df[col].astype(str).str.strip().str.upper() == "Y").sum()
-        if count > 0:
-            survey_only[_interest_label(col)] = count
     if survey_only:
         top_survey = sorted(survey_only.items(), key=lambda x: -x[1])[:15]
         sv_labels, sv_vals = zip(*top_survey)
@@ -387,24 +544,25 @@ def create_interests_analysis(df, suffix=""):
         axes[1, 0].set_title("Survey Interests")
 
     axes[1, 1].axis("off")
-    plt.tight_layout()
-    plt.savefig(f"{OUTPUT_PREFIX}interests_analysis{suffix}.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    _save_fig(fig, f"{OUTPUT_PREFIX}interests_analysis{suffix}.png")
 
 
-def create_summary_dashboard(df, suffix=""):
+def create_summary_dashboard(df, suffix="", counts=None, col_set=None, stats=None):
     """Create high-level summary dashboard for FullContact."""
     print(f"Creating summary dashboard{suffix}...")
-    fig, axes = plt.subplots(2, 2, figsize=(20, 12))
+    if counts is None:
+        counts = precompute_counts(df, col_set)
+    if stats is None:
+        stats = compute_stats(df, col_set)
+    fig, axes = get_fig((20, 12))
     fig.suptitle("User Base Summary (FullContact)", fontsize=18, fontweight="bold")
 
-    total_users = len(df)
-    state_col = _state_col(df)
-    city_col = _city_col(df)
-    gender_col = _gender_col(df)
+    state_col = _state_col(df, col_set)
+    city_col = _city_col(df, col_set)
+    gender_col = _gender_col(df, col_set)
 
     if state_col:
-        state_counts = df[state_col].dropna().astype(str).value_counts().head(10)
+        state_counts = counts["state"].head(10)
         if len(state_counts) > 0:
             axes[0, 0].bar(range(len(state_counts)), state_counts.values, color="skyblue")
             axes[0, 0].set_xticks(range(len(state_counts)))
@@ -416,7 +574,7 @@ def create_summary_dashboard(df, suffix=""):
         axes[0, 0].set_title("Top 10 Regions")
 
     if gender_col:
-        gender_counts = df[gender_col].dropna().astype(str).value_counts()
+        gender_counts = counts["gender"]
         if len(gender_counts) > 0:
             axes[0, 1].pie(gender_counts.values, labels=gender_counts.index, autopct="%1.1f%%")
         axes[0, 1].set_title("User Demographics (Gender)")
@@ -424,17 +582,17 @@ def create_summary_dashboard(df, suffix=""):
         axes[0, 1].text(0.5, 0.5, "No gender data", ha="center", va="center", transform=axes[0, 1].transAxes)
         axes[0, 1].set_title("User Demographics")
 
-    stats_text = f"Total users: {total_users:,}\n"
+    stats_text = f"Total users: {stats['total_users']:,}\n"
     if state_col:
-        stats_text += f"Regions: {df[state_col].dropna().nunique()}\n"
+        stats_text += f"Regions: {stats['unique_states']}\n"
     if city_col:
-        stats_text += f"Cities: {df[city_col].dropna().nunique()}\n"
+        stats_text += f"Cities: {stats['unique_cities']}\n"
     axes[1, 0].text(0.1, 0.5, stats_text, transform=axes[1, 0].transAxes, fontsize=12, verticalalignment="center")
     axes[1, 0].axis("off")
     axes[1, 0].set_title("Overview")
 
     if city_col:
-        city_counts = df[city_col].dropna().astype(str).value_counts().head(10)
+        city_counts = counts["city"].head(10)
         if len(city_counts) > 0:
             axes[1, 1].barh(range(len(city_counts)), city_counts.values, color="orange")
             axes[1, 1].set_yticks(range(len(city_counts)))
@@ -444,43 +602,32 @@ def create_summary_dashboard(df, suffix=""):
     else:
         axes[1, 1].axis("off")
 
-    plt.tight_layout()
-    plt.savefig(f"{OUTPUT_PREFIX}summary_dashboard{suffix}.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    _save_fig(fig, f"{OUTPUT_PREFIX}summary_dashboard{suffix}.png")
 
 
-def generate_html_dashboard(df, suffix=""):
-    """Generate HTML dashboard that embeds FullContact charts."""
-    print(f"Generating FullContact HTML dashboard{suffix}...")
-    total_users = len(df)
-    state_col = _state_col(df)
-    city_col = _city_col(df)
-    unique_states = df[state_col].dropna().nunique() if state_col else 0
-    unique_cities = df[city_col].dropna().nunique() if city_col else 0
-    from datetime import datetime
-    current_time = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-
-    html_content = f"""<!DOCTYPE html>
+# Compiled once at import; per-store renders only substitute the handful of
+# dynamic fields instead of rebuilding the whole page string
+_HTML_TMPL = string.Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>FullContact User Analysis Dashboard</title>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; background: #f8f9fa; }}
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 20px; }}
-        header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px 0; margin-bottom: 30px; border-radius: 10px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }}
-        header h1 {{ font-size: 2.5em; margin-bottom: 10px; }}
-        header p {{ font-size: 1.2em; opacity: 0.9; }}
-        .section {{ background: white; margin-bottom: 40px; border-radius: 10px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .section-header {{ background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; padding: 25px; }}
-        .section-content {{ padding: 30px; }}
-        .chart-container {{ text-align: center; }}
-        .chart-container img {{ max-width: 100%; height: auto; border-radius: 8px; box-shadow: 0 4px 15px rgba(0,0,0,0.1); }}
-        nav {{ background: white; padding: 20px; border-radius: 10px; margin-bottom: 30px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        nav a {{ color: #667eea; text-decoration: none; padding: 10px 20px; border-radius: 25px; }}
-        nav a:hover {{ background: #667eea; color: white; }}
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; background: #f8f9fa; }
+        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
+        header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px 0; margin-bottom: 30px; border-radius: 10px; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+        header h1 { font-size: 2.5em; margin-bottom: 10px; }
+        header p { font-size: 1.2em; opacity: 0.9; }
+        .section { background: white; margin-bottom: 40px; border-radius: 10px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .section-header { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; padding: 25px; }
+        .section-content { padding: 30px; }
+        .chart-container { text-align: center; }
+        .chart-container img { max-width: 100%; height: auto; border-radius: 8px; box-shadow: 0 4px 15px rgba(0,0,0,0.1); }
+        nav { background: white; padding: 20px; border-radius: 10px; margin-bottom: 30px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        nav a { color: #667eea; text-decoration: none; padding: 10px 20px; border-radius: 25px; }
+        nav a:hover { background: #667eea; color: white; }
     </style>
 </head>
 <body>
@@ -488,7 +635,7 @@ def generate_html_dashboard(df, suffix=""):
         <header>
             <h1>FullContact User Analysis</h1>
             <p>Demographics & geographic insights from fullcontact_matches</p>
-            <p style="font-size: 0.95em; margin-top: 8px;">{total_users:,} records | Generated {current_time}</p>
+            <p style="font-size: 0.95em; margin-top: 8px;">${total_users} records | Generated ${current_time}</p>
         </header>
         <nav>
             <a href="#summary">Summary</a>
@@ -500,36 +647,51 @@ def generate_html_dashboard(df, suffix=""):
         <section id="summary" class="section">
             <div class="section-header"><h2>Executive Summary</h2></div>
             <div class="section-content">
-                <div class="chart-container"><img src="{OUTPUT_PREFIX}summary_dashboard{suffix}.png" alt="Summary"></div>
+                <div class="chart-container"><img src="${prefix}summary_dashboard${suffix}.png" alt="Summary"></div>
             </div>
         </section>
         <section id="geographic" class="section">
             <div class="section-header"><h2>Geographic Distribution</h2></div>
             <div class="section-content">
-                <div class="chart-container"><img src="{OUTPUT_PREFIX}geographic_analysis{suffix}.png" alt="Geographic"></div>
+                <div class="chart-container"><img src="${prefix}geographic_analysis${suffix}.png" alt="Geographic"></div>
             </div>
         </section>
         <section id="demographics" class="section">
             <div class="section-header"><h2>Demographics</h2></div>
             <div class="section-content">
-                <div class="chart-container"><img src="{OUTPUT_PREFIX}demographic_analysis{suffix}.png" alt="Demographics"></div>
+                <div class="chart-container"><img src="${prefix}demographic_analysis${suffix}.png" alt="Demographics"></div>
             </div>
         </section>
         <section id="financial" class="section">
             <div class="section-header"><h2>Financial Profile</h2></div>
             <div class="section-content">
-                <div class="chart-container"><img src="{OUTPUT_PREFIX}financial_analysis{suffix}.png" alt="Financial"></div>
+                <div class="chart-container"><img src="${prefix}financial_analysis${suffix}.png" alt="Financial"></div>
             </div>
         </section>
         <section id="interests" class="section">
             <div class="section-header"><h2>Interests</h2></div>
             <div class="section-content">
-                <div class="chart-container"><img src="{OUTPUT_PREFIX}interests_analysis{suffix}.png" alt="Interests"></div>
+                <div class="chart-container"><img src="${prefix}interests_analysis${suffix}.png" alt="Interests"></div>
             </div>
         </section>
     </div>
 </body>
-</html>"""
+</html>""")
+
+
+def generate_html_dashboard(df, suffix="", stats=None):
+    """Generate HTML dashboard that embeds FullContact charts."""
+    print(f"Generating FullContact HTML dashboard{suffix}...")
+    total_users = stats["total_users"] if stats else len(df)
+    from datetime import datetime
+    current_time = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+
+    html_content = _HTML_TMPL.substitute(
+        total_users=f"{total_users:,}",
+        current_time=current_time,
+        prefix=OUTPUT_PREFIX,
+        suffix=suffix,
+    )
 
     filename = f"{OUTPUT_PREFIX}user_dashboard{suffix}.html"
     with open(filename, "w", encoding="utf-8") as f:
@@ -537,6 +699,21 @@ def generate_html_dashboard(df, suffix=""):
     print(f"✅ FullContact HTML dashboard written: {filename}")
 
 
+def _render_store(task):
+    """Render one dataset's full chart set; also runs in worker processes."""
+    data, suf = task
+    col_set = frozenset(data.columns)
+    col_groups = classify_columns(data.columns)
+    counts = precompute_counts(data, col_set)
+    stats = compute_stats(data, col_set)
+    create_summary_dashboard(data, suffix=suf, counts=counts, col_set=col_set, stats=stats)
+    create_geographic_analysis(data, suffix=suf, counts=counts, col_set=col_set)
+    create_demographic_analysis(data, suffix=suf, counts=counts, col_set=col_set)
+    create_financial_analysis(data, suffix=suf)
+    create_interests_analysis(data, suffix=suf, col_groups=col_groups)
+    generate_html_dashboard(data, suffix=suf, stats=stats)
+
+
 def _store_id_to_suffix(store_id):
     if store_id is None or (isinstance(store_id, float) and np.isnan(store_id)):
         return ""
@@ -600,33 +777,48 @@ def main():
         email_column=args.email_col,
         data_column=args.data_col,
         store_column=args.store_col,
+        chunksize=100_000,
+        dtype_backend="pyarrow" if pyarrow is not None else None,
     )
-    df = normalize_numeric_columns(df)
+    df = normalize_dtypes(df)
     print(f"Records: {len(df):,} | Columns: {len(df.columns)}")
 
     has_store = "external_store_id" in df.columns and df["external_store_id"].notna().any()
-    stores = df["external_store_id"].dropna().unique().tolist() if has_store else []
-
-    def run(data, suf, label):
-        create_summary_dashboard(data, suffix=suf)
-        create_geographic_analysis(data, suffix=suf)
-        create_demographic_analysis(data, suffix=suf)
-        create_financial_analysis(data, suffix=suf)
-        create_interests_analysis(data, suffix=suf)
-        generate_html_dashboard(data, suffix=suf)
-
-    run(df, "", "all")
-    if has_store and stores:
-        for store_id in stores:
-            file_suffix = _store_id_to_suffix(store_id)
-            if not file_suffix:
-                continue
-            suf = "_" + file_suffix
-            df_store = df[df["external_store_id"] == store_id]
-            if len(df_store) == 0:
-                continue
-            print(f"\n--- Store: {store_id} ({len(df_store):,} records) ---")
-            run(df_store, suf, str(store_id))
+    store_slices = {}
+    if has_store:
+        # Sort once so every store occupies a contiguous block; each store is
+        # then a zero-copy iloc slice of the sorted frame instead of a
+        # row-gathering copy (NaN store ids sort to the end and are skipped).
+        # codes[start] below is safe only because the notna().any() guard
+        # above guarantees at least one row
+        df["external_store_id"] = df["external_store_id"].astype("category")
+        df = df.sort_values("external_store_id", kind="stable", ignore_index=True)
+        codes = df["external_store_id"].cat.codes.to_numpy()
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        bounds = np.r_[starts, len(codes)]
+        categories = df["external_store_id"].cat.categories
+        for i, start in enumerate(starts):
+            if codes[start] >= 0:
+                store_slices[categories[codes[start]]] = (int(start), int(bounds[i + 1]))
+    stores = list(store_slices)
+
+    _render_store((df, ""))
+
+    # Per-store dashboards are independent (distinct output files, read-only
+    # input slices) — render them concurrently
+    tasks = []
+    # Narrow once to the rendered columns so each pickled store slice ships
+    # without the unused bulk of the flattened payload
+    df_used = df[used_columns(df.columns)] if store_slices else df
+    for store_id, (start, stop) in store_slices.items():
+        file_suffix = _store_id_to_suffix(store_id)
+        if not file_suffix or stop <= start:
+            continue
+        print(f"\n--- Store: {store_id} ({stop - start:,} records) ---")
+        tasks.append((df_used.iloc[start:stop], "_" + file_suffix))
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+            list(executor.map(_render_store, tasks))
 
     print("\n✅ FullContact analysis complete. Outputs:")
     print(f"  {OUTPUT_PREFIX}summary_dashboard.png, {OUTPUT_PREFIX}geographic_analysis.png,")
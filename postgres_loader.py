@@ -4,13 +4,28 @@ Load Data Axle match data from PostgreSQL matched_emails table and flatten
 to the same column structure expected by user_analysis_dashboard.py (CSV-style).
 """
 
+import io
 import json
 import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow  # noqa: F401 - enables the Arrow-backed string dtype
+    _STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    _STRING_DTYPE = "string"
+
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
     from psycopg2 import sql
 except ImportError:
     psycopg2 = None
@@ -19,22 +34,99 @@ except ImportError:
 
 PREFIX = "data.document.attributes"
 
+# Scalar leaves projected server-side for hot paths (vendor comparison):
+# flat column name -> path inside response_json
+HOT_PATHS = {
+    f"{PREFIX}.gender": ("data", "document", "attributes", "gender"),
+    f"{PREFIX}.state": ("data", "document", "attributes", "state"),
+    f"{PREFIX}.city": ("data", "document", "attributes", "city"),
+    f"{PREFIX}.family.estimated_income": ("data", "document", "attributes", "family", "estimated_income"),
+}
+
+
+def _compact_dtypes(df: pd.DataFrame, max_categories: int = 64) -> pd.DataFrame:
+    """Shrink string-ish columns: low-cardinality -> category, all-string -> Arrow string.
+
+    Categories store one small int per row plus a tiny dictionary; Arrow
+    strings drop the per-value PyObject overhead. Mixed-type high-cardinality
+    columns are left as object so values are not silently stringified.
+    """
+    converted = {}
+    for c in df.columns:
+        dtype = df[c].dtype
+        is_str = isinstance(dtype, pd.StringDtype)
+        if not is_str and dtype != object:
+            continue
+        col = df[c]
+        if col.nunique(dropna=True) < max_categories:
+            converted[c] = col.astype("category")
+        elif not is_str and pd.api.types.infer_dtype(col, skipna=True) == "string":
+            converted[c] = col.astype(_STRING_DTYPE)
+    return df.assign(**converted) if converted else df
+
+
+def _loads(raw):
+    """Parse a JSON payload (str/bytes) with orjson's native parser when available."""
+    if isinstance(raw, memoryview):
+        raw = bytes(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
-def _flatten_value(prefix: str, value, out: dict) -> None:
-    """Recursively flatten a value into out with keys like data.document.attributes.*"""
-    if value is None:
-        out[prefix] = None
-        return
-    if isinstance(value, dict):
-        for k, v in value.items():
-            key = k if k.isidentifier() or k.replace(" ", "_").replace("-", "_").replace(".", "_").isidentifier() else k
-            _flatten_value(f"{prefix}.{key}", v, out)
-        return
-    if isinstance(value, list):
-        for i, item in enumerate(value):
-            _flatten_value(f"{prefix}[{i}]", item, out)
-        return
-    out[prefix] = value
+def _flatten_into(root_items, out: dict) -> None:
+    """Iteratively flatten (prefix, value) pairs into out with keys like data.document.attributes.*
+
+    An explicit stack replaces recursion: no Python call frame per nested node
+    and no RecursionError on pathologically deep payloads. Children are pushed
+    reversed so keys land in out in document order.
+    """
+    stack = list(root_items)
+    stack.reverse()
+    while stack:
+        prefix, value = stack.pop()
+        if isinstance(value, dict):
+            # Hoist the separator concat out of the per-key loop
+            prefix_dot = prefix + "."
+            # Most dicts in these payloads are shallow and scalar-only; write
+            # their leaves in one tight loop instead of round-tripping each
+            # through the stack (the exact type check is faster than
+            # isinstance and skips bool/int subclass surprises)
+            if all(v is None or type(v) in (str, int, float, bool) for v in value.values()):
+                out.update((sys.intern(prefix_dot + k), v) for k, v in value.items())
+                continue
+            stack.extend((prefix_dot + k, v) for k, v in reversed(value.items()))
+        elif isinstance(value, list):
+            stack.extend((f"{prefix}[{i}]", item) for i, item in reversed(list(enumerate(value))))
+        else:
+            # Interned keys: every row's copy of a column name collapses to
+            # one shared string, so downstream dict lookups hash-compare fast
+            out[sys.intern(prefix)] = value
+
+
+def _extend_columns(cols: dict, nrows: int, flats) -> int:
+    """Append flat row dicts to a dict-of-lists column store; returns the new row count.
+
+    Feeding pandas aligned column lists avoids the key-union inference and
+    row-to-column transpose it performs on a list of sparse dicts.
+    """
+    for flat in flats:
+        for k, v in flat.items():
+            arr = cols.get(k)
+            if arr is None:
+                cols[k] = arr = [None] * nrows
+            elif len(arr) < nrows:
+                arr.extend([None] * (nrows - len(arr)))
+            arr.append(v)
+        nrows += 1
+    return nrows
+
+
+def _pad_columns(cols: dict, nrows: int) -> None:
+    """Right-pad columns missing from the trailing rows so all lists align."""
+    for arr in cols.values():
+        if len(arr) < nrows:
+            arr.extend([None] * (nrows - len(arr)))
 
 
 def _flatten_document(doc: dict) -> dict:
@@ -45,8 +137,7 @@ def _flatten_document(doc: dict) -> dict:
     attrs = doc.get("attributes") if "attributes" in doc else doc
     if not isinstance(attrs, dict):
         return out
-    for key, value in attrs.items():
-        _flatten_value(f"{PREFIX}.{key}", value, out)
+    _flatten_into(((f"{PREFIX}.{key}", value) for key, value in attrs.items()), out)
     return out
 
 
@@ -60,12 +151,133 @@ def _row_to_flat(email: str, raw: dict) -> dict:
     return flat
 
 
+_HOT_PREFIX = ("data", "document", "attributes")
+
+
+def _strip_wrapper(path):
+    """Drop the synthetic data/document/attributes wrapper segments from a path.
+
+    HOT_PATHS keys mirror the flattened column names, but the data. prefix is
+    added by _flatten_document — it is not a key in the stored JSON, which is
+    either {"document": {"attributes": ...}} or the bare attributes dict.
+    """
+    steps = tuple(path)
+    while steps and steps[0] in _HOT_PREFIX:
+        steps = steps[1:]
+    return steps
+
+
+def _compile_extractor(path):
+    """Compile a HOT_PATHS-style segment tuple into a getter closure.
+
+    Built once per load; per row it walks O(len(path)) dict/list lookups over
+    the attributes dict instead of flattening every leaf. The server-side
+    data/document/attributes wrapper segments are stripped because the walker
+    starts from the same attributes dict _flatten_document resolves.
+    """
+    steps = _strip_wrapper(path)
+
+    def get(obj, _steps=steps):
+        for step in _steps:
+            if type(step) is int:
+                if isinstance(obj, list) and -len(obj) <= step < len(obj):
+                    obj = obj[step]
+                else:
+                    return None
+            elif isinstance(obj, dict):
+                obj = obj.get(step)
+            else:
+                return None
+            if obj is None:
+                return None
+        return obj
+
+    return get
+
+
+def _copy_frame(conn, table, columns, store_column, store_filter):
+    """Bulk-extract rows with COPY ... TO STDOUT (FORMAT CSV) into a DataFrame.
+
+    COPY is the fastest Postgres read path: one round-trip, no per-row DBAPI
+    object construction; the CSV lands in an in-memory buffer for pd.read_csv.
+    """
+    inner = sql.SQL("SELECT {} FROM {}").format(
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+        sql.Identifier(table),
+    )
+    if store_filter is not None and store_column:
+        inner = sql.SQL("{} WHERE {} = {}").format(inner, sql.Identifier(store_column), sql.Literal(store_filter))
+    buf = io.StringIO()
+    with conn.cursor() as cur:
+        cur.copy_expert(sql.SQL("COPY ({}) TO STDOUT WITH (FORMAT CSV, HEADER)").format(inner), buf)
+    buf.seek(0)
+    return pd.read_csv(buf, dtype=str)
+
+
+def _rows_to_records(rows, store_column, extractors=None, wanted=None):
+    """Flatten a batch of tuple rows (email, payload[, store]) into dashboard-shaped dicts.
+
+    Rows are positional in SELECT order — no per-row dict construction on
+    the cursor side. With extractors (name -> compiled getter pairs), only
+    those paths are pulled out of each payload instead of flattening every
+    leaf. A wanted frozenset of flat names drops every other flattened key
+    so the column store (and DataFrame) never materializes unused columns.
+    """
+    records = []
+    has_store = bool(store_column)
+    for row in rows:
+        email = row[0]
+        raw = row[1]
+        if isinstance(raw, (str, bytes, bytearray, memoryview)):
+            try:
+                raw = _loads(raw)
+            except json.JSONDecodeError:
+                raw = None
+        if extractors is not None:
+            flat = {"email": email}
+            if isinstance(raw, dict):
+                doc = raw.get("document") if "document" in raw else raw
+                attrs = doc.get("attributes") if isinstance(doc, dict) and "attributes" in doc else doc
+                if isinstance(attrs, dict):
+                    for name, get in extractors:
+                        flat[name] = get(attrs)
+        elif raw is None:
+            flat = {"email": email}
+        else:
+            flat = _row_to_flat(email, raw)
+            if wanted is not None:
+                flat = {k: v for k, v in flat.items() if k in wanted}
+        if has_store:
+            flat["external_store_id"] = row[2]
+        records.append(flat)
+    return records
+
+
+def _flatten_batch(args):
+    """Process-pool entry: flatten one batch of tuple rows in a worker.
+
+    Takes (rows, store_column, paths, wanted) as a single picklable tuple;
+    extractor closures can't cross process boundaries, so they are recompiled
+    from paths inside the worker (a few closures per batch, not per row).
+    """
+    rows, store_column, paths, wanted = args
+    extractors = None
+    if paths is not None:
+        extractors = [(sys.intern(name), _compile_extractor(p)) for name, p in paths.items()]
+    return _rows_to_records(rows, store_column, extractors, wanted)
+
+
 def load_from_postgres(
     connection_string: str = None,
     table: str = "matched_emails",
     email_column: str = "email",
     data_column: str = "response_json",
     store_column: str = "external_store_id",
+    store_filter: str = None,
+    use_copy: bool = False,
+    paths: dict = None,
+    columns=None,
+    workers: int = None,
 ) -> pd.DataFrame:
     """
     Load Data Axle match data from PostgreSQL and return a DataFrame with the same
@@ -73,10 +285,25 @@ def load_from_postgres(
 
     Expected table columns: email, response_json (JSON/JSONB with match result),
     and optionally external_store_id (or store_column) for per-store dashboards.
+    store_filter pushes a WHERE store_column = ... predicate to the server so
+    single-store loads never transfer (or parse) the rest of the table.
+    paths (flat column name -> segment tuple, e.g. HOT_PATHS) extracts only
+    those leaves per row instead of flattening the whole payload; columns
+    keeps just the named flat columns when only their dotted paths are known.
+    workers (e.g. os.cpu_count()) flattens fetched batches in that many
+    worker processes — worth it for full flattens of wide payloads, not for
+    narrow paths= loads where pickling would dominate.
     """
     if psycopg2 is None:
         raise ImportError("psycopg2 is required for PostgreSQL. Install with: pip install psycopg2-binary")
 
+    extractors = None
+    if paths is not None:
+        extractors = [(sys.intern(name), _compile_extractor(p)) for name, p in paths.items()]
+    wanted = None
+    if columns is not None:
+        wanted = frozenset(columns) | {"email", "external_store_id"}
+
     conn_str = (
         connection_string
         or os.environ.get("DATABASE_URL")
@@ -87,17 +314,134 @@ def load_from_postgres(
             "PostgreSQL connection string required. Set DATABASE_URL or POSTGRES_URI, or pass connection_string=..."
         )
 
-    columns = [email_column, data_column]
+    select_cols = [email_column, data_column]
     if store_column:
-        columns.append(store_column)
+        select_cols.append(store_column)
 
     print(f"Connecting to PostgreSQL and reading from {table}...")
     conn = psycopg2.connect(conn_str)
+    cols = {}
+    nrows = 0
+
+    if use_copy:
+        try:
+            raw_df = _copy_frame(conn, table, select_cols, store_column, store_filter)
+        finally:
+            conn.close()
+        if raw_df.empty:
+            print("No rows found in matched_emails.")
+            return pd.DataFrame()
+        nrows = _extend_columns(
+            cols, 0, _rows_to_records(raw_df.itertuples(index=False, name=None), store_column, extractors, wanted)
+        )
+        _pad_columns(cols, nrows)
+        df = _compact_dtypes(pd.DataFrame(cols))
+        print(f"Loaded {len(df):,} records from PostgreSQL ({len(df.columns)} columns)")
+        return df
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+    pending = deque()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        # Named cursor: the server streams rows in itersize batches instead of
+        # the client materializing the whole result set before flattening
+        with conn.cursor(name="da_stream") as cur:
+            cur.itersize = 50_000
+            query = sql.SQL("SELECT {} FROM {}").format(
+                sql.SQL(", ").join(map(sql.Identifier, select_cols)),
+                sql.Identifier(table),
+            )
+            params = ()
+            if store_filter is not None and store_column:
+                query = sql.SQL("{} WHERE {} = %s").format(query, sql.Identifier(store_column))
+                params = (store_filter,)
+            cur.execute(query, params)
+            while True:
+                rows = cur.fetchmany(50_000)
+                if not rows:
+                    break
+                if executor is None:
+                    nrows = _extend_columns(cols, nrows, _rows_to_records(rows, store_column, extractors, wanted))
+                    continue
+                # Sub-batches keep every worker busy; flattening overlaps the
+                # next fetch, and a bounded pending queue caps memory
+                for i in range(0, len(rows), 5_000):
+                    pending.append(executor.submit(_flatten_batch, (rows[i:i + 5_000], store_column, paths, wanted)))
+                while len(pending) > 2 * workers:
+                    nrows = _extend_columns(cols, nrows, pending.popleft().result())
+        while pending:
+            nrows = _extend_columns(cols, nrows, pending.popleft().result())
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        conn.close()
+
+    if nrows == 0:
+        print("No rows found in matched_emails.")
+        return pd.DataFrame()
+
+    _pad_columns(cols, nrows)
+    df = _compact_dtypes(pd.DataFrame(cols))
+    print(f"Loaded {len(df):,} records from PostgreSQL ({len(df.columns)} columns)")
+    return df
+
+
+def load_projected(
+    connection_string: str = None,
+    table: str = "matched_emails",
+    paths: dict = None,
+    email_column: str = "email",
+    data_column: str = "response_json",
+    store_column: str = "external_store_id",
+) -> pd.DataFrame:
+    """
+    Project scalar JSON leaves to columns inside PostgreSQL instead of shipping
+    whole response_json blobs to Python.
+
+    paths maps output column name -> tuple of JSON path segments; each becomes
+    a `response_json #>> '{...}'` expression, so the database does the
+    flattening once in C and the DataFrame is built straight from tuples.
+    Defaults to HOT_PATHS (the vendor-comparison columns). The synthetic
+    data/document/attributes wrapper segments are stripped and both stored
+    shapes ({"document": {"attributes": ...}} and bare attributes) are
+    covered with a COALESCE, matching what _flatten_document resolves.
+    """
+    if psycopg2 is None:
+        raise ImportError("psycopg2 is required for PostgreSQL. Install with: pip install psycopg2-binary")
+
+    conn_str = (
+        connection_string
+        or os.environ.get("DATABASE_URL")
+        or os.environ.get("POSTGRES_URI")
+    )
+    if not conn_str:
+        raise ValueError(
+            "PostgreSQL connection string required. Set DATABASE_URL or POSTGRES_URI, or pass connection_string=..."
+        )
+
+    paths = paths or HOT_PATHS
+    select_items = [sql.Identifier(email_column)]
+    out_columns = ["email"]
+    if store_column:
+        select_items.append(sql.Identifier(store_column))
+        out_columns.append("external_store_id")
+    for name, path in paths.items():
+        steps = _strip_wrapper(path)
+        select_items.append(
+            sql.SQL("COALESCE({col} #>> {wrapped}, {col} #>> {bare})").format(
+                col=sql.Identifier(data_column),
+                wrapped=sql.Literal("{" + ",".join(("document", "attributes") + tuple(str(p) for p in steps)) + "}"),
+                bare=sql.Literal("{" + ",".join(str(p) for p in steps) + "}"),
+            )
+        )
+        out_columns.append(name)
+
+    print(f"Connecting to PostgreSQL and projecting {len(paths)} paths from {table}...")
+    conn = psycopg2.connect(conn_str)
+    try:
+        with conn.cursor() as cur:
             cur.execute(
                 sql.SQL("SELECT {} FROM {}").format(
-                    sql.SQL(", ").join(map(sql.Identifier, columns)),
+                    sql.SQL(", ").join(select_items),
                     sql.Identifier(table),
                 ),
                 (),
@@ -106,30 +450,6 @@ def load_from_postgres(
     finally:
         conn.close()
 
-    if not rows:
-        print("No rows found in matched_emails.")
-        return pd.DataFrame()
-
-    records = []
-    for row in rows:
-        email = row.get(email_column)
-        raw = row.get(data_column)
-        if raw is None:
-            flat = {"email": email}
-        else:
-            if isinstance(raw, str):
-                try:
-                    raw = json.loads(raw)
-                except json.JSONDecodeError:
-                    flat = {"email": email}
-                else:
-                    flat = _row_to_flat(email, raw)
-            else:
-                flat = _row_to_flat(email, raw)
-        if store_column and store_column in row:
-            flat["external_store_id"] = row.get(store_column)
-        records.append(flat)
-
-    df = pd.DataFrame(records)
-    print(f"Loaded {len(df):,} records from PostgreSQL ({len(df.columns)} columns)")
+    df = pd.DataFrame(rows, columns=out_columns)
+    print(f"Loaded {len(df):,} projected records from PostgreSQL ({len(df.columns)} columns)")
     return df
@@ -6,6 +6,7 @@ Loads data only from PostgreSQL matched_emails table (email, response_json). No
 """
 
 import argparse
+import functools
 import os
 
 # Load .env so DATABASE_URL (and POSTGRES_URI) are available
@@ -28,6 +29,84 @@ try:
 except ImportError:
     load_from_postgres = None
 
+# Optional: Polars for multi-threaded CSV parsing (falls back to pandas)
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Optional: pyarrow so loaded frames can use Arrow-backed columns
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Optional: Numba for JIT-compiled per-group count kernels (falls back to np.bincount)
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _group_counts_jit(codes, ngroups):
+        out = np.zeros(ngroups, dtype=np.int64)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            if c >= 0:
+                out[c] += 1
+        return out
+else:
+    _group_counts_jit = None
+
+
+def _group_counts(codes, ngroups):
+    """Count occurrences per integer group code (-1 = missing)."""
+    codes = np.asarray(codes, dtype=np.int64)
+    if _group_counts_jit is not None:
+        return _group_counts_jit(codes, ngroups)
+    return np.bincount(codes[codes >= 0], minlength=ngroups)
+
+
+def _fast_value_counts(series):
+    """value_counts that runs on integer category codes instead of hashing strings."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = _group_counts(series.cat.codes.values, len(series.cat.categories))
+        vc = pd.Series(counts, index=series.cat.categories).sort_values(ascending=False)
+        # Subsets inherit the parent's unobserved categories; drop zero counts
+        # so regional dashboards never report states with no rows
+        return vc[vc > 0]
+    return series.value_counts()
+
+
+def _interest_stats(df, interest_cols):
+    """
+    Per-interest user counts and score stats computed as whole-block reductions
+    (one pass over the numeric block) instead of a Python loop per column.
+    """
+    stats = {}
+    if not interest_cols:
+        return stats
+    vals = df[interest_cols].apply(pd.to_numeric, errors='coerce')
+    users = vals.notna().sum()
+    avg_scores = vals.mean()
+    high = (vals >= 7).sum()
+    moderate = ((vals >= 4) & (vals < 7)).sum()
+    low = (vals < 4).sum()
+    for col in interest_cols:
+        n = int(users[col])
+        if n == 0:
+            continue
+        interest_name = col.split('.')[-1].replace('_', ' ').title()
+        stats[interest_name] = {
+            'users': n,
+            'avg_score': float(avg_scores[col]),
+            'high_interest': int(high[col]),
+            'moderate_interest': int(moderate[col]),
+            'low_interest': int(low[col]),
+        }
+    return stats
+
 # Set style for better looking plots
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
@@ -56,10 +135,25 @@ def normalize_numeric_columns(df):
     return df
 
 
+# Cache of cleaned DataFrames keyed by (filename, mtime) so repeated dashboard
+# generations (full dataset + subsets) reuse one load instead of re-parsing the CSV.
+_LOAD_CACHE = {}
+
+
 def load_and_clean_data(filename='data_axle_results.csv'):
-    """Load and perform basic cleaning of the data"""
+    """Load and perform basic cleaning of the data (cached per file + mtime)"""
+    try:
+        mtime = os.path.getmtime(filename)
+    except OSError:
+        mtime = None
+    cache_key = (filename, mtime)
+    if cache_key in _LOAD_CACHE:
+        df = _LOAD_CACHE[cache_key]
+        print(f"Using cached data for {filename} ({len(df)} records)")
+        return df
+
     print(f"Loading data from {filename}...")
-    
+
     # Read with specific columns we need for analysis
     columns_to_read = [
         'email', 'data.document.attributes.first_name', 'data.document.attributes.last_name',
@@ -81,15 +175,39 @@ def load_and_clean_data(filename='data_axle_results.csv'):
     all_columns = pd.read_csv(filename, nrows=0).columns.tolist()
     use_cols = [col for col in all_columns if col not in exclude_cols]
     
-    try:
-        # Try to read specific columns first
-        df = pd.read_csv(filename, usecols=use_cols, low_memory=False)
-    except:
-        # If that fails, read all columns
-        print("Reading all columns...")
-        df = pd.read_csv(filename, low_memory=False)
-    
+    df = None
+    if pl is not None:
+        # Polars parses the CSV on all cores and hands the frame back to
+        # pandas through Arrow without copying the column buffers
+        try:
+            df = pl.read_csv(filename, columns=use_cols).to_pandas()
+        except Exception:
+            df = None
+
+    if df is None:
+        try:
+            # Try to read specific columns first
+            df = pd.read_csv(filename, usecols=use_cols, low_memory=False)
+        except:
+            # If that fails, read all columns
+            print("Reading all columns...")
+            df = pd.read_csv(filename, low_memory=False)
+
+    # Arrow-backed columns keep strings in contiguous buffers, so downstream
+    # filters and aggregations dispatch to vectorized Arrow kernels instead
+    # of the NumPy object path
+    if pyarrow is not None:
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+
+    # Categorical state column: regional filters then compare small integer
+    # codes instead of Python strings (see demo_dynamic_dashboard)
+    if 'data.document.attributes.state' in df.columns:
+        df['data.document.attributes.state'] = df['data.document.attributes.state'].astype('category')
+
     print(f"Loaded {len(df)} records")
+    # Keep only the latest load; the demo re-invokes this for full + subset runs
+    _LOAD_CACHE.clear()
+    _LOAD_CACHE[cache_key] = df
     return df
 
 def create_geographic_analysis(df, suffix=""):
@@ -518,6 +636,9 @@ def create_summary_dashboard(df, suffix=""):
     unique_states = df['data.document.attributes.state'].nunique() if 'data.document.attributes.state' in df.columns else 0
     unique_cities = df['data.document.attributes.city'].nunique() if 'data.document.attributes.city' in df.columns else 0
     avg_income = df['data.document.attributes.family.estimated_income'].mean() if 'data.document.attributes.family.estimated_income' in df.columns else 0
+    # pd.NA from an all-null pyarrow-backed column would break the ${...:,.0f}
+    # format below; keep the baseline's numeric behavior
+    avg_income = float(avg_income) if pd.notna(avg_income) else 0
     
     # User volume by state (top 10)
     if 'data.document.attributes.state' in df.columns:
@@ -642,20 +763,8 @@ def create_business_insights_report(df):
     # Find interest columns
     interest_cols = [col for col in df.columns if 'interests.' in col and col not in ['data.document.attributes.interests.id', 'data.document.attributes.interests.created_at']]
     
-    insights = {}
-    for col in interest_cols:
-        interest_name = col.split('.')[-1].replace('_', ' ').title()
-        interest_data = pd.to_numeric(df[col], errors='coerce').dropna()
-        
-        if len(interest_data) > 0:
-            insights[interest_name] = {
-                'users': len(interest_data),
-                'avg_score': interest_data.mean(),
-                'high_interest': (interest_data >= 7).sum(),
-                'moderate_interest': ((interest_data >= 4) & (interest_data < 7)).sum(),
-                'low_interest': (interest_data < 4).sum()
-            }
-    
+    insights = _interest_stats(df, interest_cols)
+
     # Business segments based on interests
     print("\n🎯 KEY BUSINESS INSIGHTS:")
     print("=" * 50)
@@ -689,98 +798,70 @@ def create_business_insights_report(df):
         for i, (interest, data) in enumerate(mass_market):
             print(f"{i+1}. {interest}: {data['users']:,} users (avg: {data['avg_score']:.1f}/9)")
 
-def generate_html_dashboard(df, suffix=""):
-    """Generate HTML dashboard that combines all visualizations with dynamic content"""
-    print(f"Generating dynamic HTML dashboard{suffix}...")
-    
-    # Calculate key metrics from the data
-    total_users = len(df)
-    unique_states = df['data.document.attributes.state'].nunique() if 'data.document.attributes.state' in df.columns else 0
-    unique_cities = df['data.document.attributes.city'].nunique() if 'data.document.attributes.city' in df.columns else 0
-    
-    # Calculate interest insights
-    interest_cols = [col for col in df.columns if 'interests.' in col and col not in ['data.document.attributes.interests.id', 'data.document.attributes.interests.created_at']]
-    total_interests = 0
-    high_value_interests = []
-    emerging_opportunities = []
-    mass_market_interests = []
-    
-    interest_analysis = {}
-    for col in interest_cols:
-        interest_name = col.split('.')[-1].replace('_', ' ').title()
-        interest_data = pd.to_numeric(df[col], errors='coerce').dropna()
-        
-        if len(interest_data) > 0:
-            interest_analysis[interest_name] = {
-                'users': len(interest_data),
-                'avg_score': interest_data.mean(),
-                'high_interest': (interest_data >= 7).sum(),
-                'moderate_interest': ((interest_data >= 4) & (interest_data < 7)).sum(),
-                'low_interest': (interest_data < 4).sum()
-            }
-    
-    total_interests = len(interest_analysis)
-    
-    if interest_analysis:
-        # High-value segments (high engagement + volume)
-        high_value_temp = sorted(interest_analysis.items(), 
-                                key=lambda x: x[1]['high_interest'] * x[1]['avg_score'], 
-                                reverse=True)[:3]
-        high_value_interests = high_value_temp
-        
-        # Emerging opportunities
-        emerging_temp = sorted([(k, v) for k, v in interest_analysis.items() if v['users'] >= 50 and v['avg_score'] >= 6], 
-                              key=lambda x: x[1]['avg_score'], reverse=True)[:3]
-        emerging_opportunities = emerging_temp
-        
-        # Mass market interests
-        mass_market_temp = sorted(interest_analysis.items(), key=lambda x: x[1]['users'], reverse=True)[:3]
-        mass_market_interests = mass_market_temp
-    
-    # Geographic insights
-    top_states = []
-    if 'data.document.attributes.state' in df.columns:
-        state_counts = df['data.document.attributes.state'].value_counts().head(3)
-        for state, count in state_counts.items():
-            pct = (count / total_users) * 100
-            top_states.append((state, count, pct))
-    
-    # Income insights
-    avg_income = 0
-    if 'data.document.attributes.family.estimated_income' in df.columns:
-        avg_income = df['data.document.attributes.family.estimated_income'].mean()
-    
-    # Generate current timestamp
-    from datetime import datetime
-    current_time = datetime.now().strftime("%B %d, %Y at %I:%M %p")
-    
-    html_content = f'''<!DOCTYPE html>
+@functools.lru_cache(maxsize=None)
+def _region_banner(region):
+    """
+    Pre-render the region-specific header fragment once per region.
+    Regional dashboards differ only in this constant string, so repeated
+    builds for the same region reuse the specialized fragment instead of
+    re-interpolating it every call.
+    """
+    if not region:
+        return ""
+    return ('            <p style="font-size: 1em; margin-top: 8px; opacity: 0.9;">'
+            f'Region: {region}</p>\n')
+
+
+def build_state_cube(df):
+    """
+    Precompute per-state aggregates (record count, income sum/count/mean) so
+    regional drill-downs are O(1) row lookups instead of full-frame rescans.
+    Counts and sums are distributive, so totals can be derived by summing
+    cube rows. Returns None when there is no state column.
+    """
+    state_col = 'data.document.attributes.state'
+    if state_col not in df.columns:
+        return None
+    grouped = df.groupby(state_col, observed=True)
+    cube = pd.DataFrame({'users': grouped.size()})
+    income_col = 'data.document.attributes.family.estimated_income'
+    if income_col in df.columns:
+        cube['income_sum'] = grouped[income_col].sum()
+        cube['income_count'] = grouped[income_col].count()
+        cube['avg_income'] = cube['income_sum'] / cube['income_count']
+    return cube
+
+
+# Static head of the HTML dashboard (styles + boilerplate). Built once at
+# import so repeated generate_html_dashboard calls skip re-interpolating the
+# several-KB style sheet through the f-string machinery.
+_DASHBOARD_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>User Demographics & Behavior Analysis Dashboard</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
             background-color: #f8f9fa;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        header {{
+        header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px 0;
@@ -788,217 +869,217 @@ def generate_html_dashboard(df, suffix=""):
             border-radius: 10px;
             text-align: center;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
+        }
         
-        header h1 {{
+        header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
             font-weight: 300;
-        }}
+        }
         
-        header p {{
+        header p {
             font-size: 1.2em;
             opacity: 0.9;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 25px;
             border-radius: 10px;
             text-align: center;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             transition: transform 0.3s ease;
-        }}
+        }
         
-        .stat-card:hover {{
+        .stat-card:hover {
             transform: translateY(-5px);
-        }}
+        }
         
-        .stat-number {{
+        .stat-number {
             font-size: 2.5em;
             font-weight: bold;
             color: #667eea;
             margin-bottom: 10px;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             color: #666;
             font-size: 1.1em;
-        }}
+        }
         
-        .nav-menu {{
+        .nav-menu {
             background: white;
             padding: 20px;
             border-radius: 10px;
             margin-bottom: 30px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .nav-menu ul {{
+        .nav-menu ul {
             list-style: none;
             display: flex;
             flex-wrap: wrap;
             justify-content: center;
             gap: 30px;
-        }}
+        }
         
-        .nav-menu a {{
+        .nav-menu a {
             color: #667eea;
             text-decoration: none;
             font-weight: 500;
             padding: 10px 20px;
             border-radius: 25px;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .nav-menu a:hover {{
+        .nav-menu a:hover {
             background: #667eea;
             color: white;
-        }}
+        }
         
-        .section {{
+        .section {
             background: white;
             margin-bottom: 40px;
             border-radius: 10px;
             overflow: hidden;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .section-header {{
+        .section-header {
             background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
             color: white;
             padding: 25px;
-        }}
+        }
         
-        .section-header h2 {{
+        .section-header h2 {
             font-size: 1.8em;
             margin-bottom: 10px;
-        }}
+        }
         
-        .section-header p {{
+        .section-header p {
             opacity: 0.9;
             font-size: 1.1em;
-        }}
+        }
         
-        .section-content {{
+        .section-content {
             padding: 30px;
-        }}
+        }
         
-        .chart-container {{
+        .chart-container {
             text-align: center;
             margin-bottom: 30px;
-        }}
+        }
         
-        .chart-container img {{
+        .chart-container img {
             max-width: 100%;
             height: auto;
             border-radius: 8px;
             box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .insights-grid {{
+        .insights-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 25px;
             margin-top: 30px;
-        }}
+        }
         
-        .insight-card {{
+        .insight-card {
             background: #f8f9fa;
             padding: 25px;
             border-radius: 10px;
             border-left: 5px solid #667eea;
-        }}
+        }
         
-        .insight-card h4 {{
+        .insight-card h4 {
             color: #667eea;
             margin-bottom: 15px;
             font-size: 1.2em;
-        }}
+        }
         
-        .insight-card ul {{
+        .insight-card ul {
             list-style: none;
-        }}
+        }
         
-        .insight-card li {{
+        .insight-card li {
             margin-bottom: 8px;
             padding-left: 20px;
             position: relative;
-        }}
+        }
         
-        .insight-card li:before {{
+        .insight-card li:before {
             content: "▶";
             color: #667eea;
             position: absolute;
             left: 0;
-        }}
+        }
         
-        .business-insights {{
+        .business-insights {
             background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
             padding: 30px;
             border-radius: 10px;
             margin: 30px 0;
-        }}
+        }
         
-        .business-insights h3 {{
+        .business-insights h3 {
             color: #2c3e50;
             margin-bottom: 20px;
             font-size: 1.5em;
-        }}
+        }
         
-        .insights-columns {{
+        .insights-columns {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 25px;
-        }}
+        }
         
-        .insight-column h4 {{
+        .insight-column h4 {
             color: #34495e;
             margin-bottom: 15px;
             font-size: 1.2em;
-        }}
+        }
         
-        .insight-item {{
+        .insight-item {
             background: rgba(255,255,255,0.7);
             padding: 15px;
             border-radius: 8px;
             margin-bottom: 10px;
-        }}
+        }
         
-        .insight-item strong {{
+        .insight-item strong {
             color: #2c3e50;
-        }}
+        }
         
-        footer {{
+        footer {
             background: #2c3e50;
             color: white;
             text-align: center;
             padding: 30px;
             border-radius: 10px;
             margin-top: 40px;
-        }}
+        }
         
-        .methodology {{
+        .methodology {
             background: #e8f4f8;
             padding: 25px;
             border-radius: 10px;
             margin: 30px 0;
             border-left: 5px solid #17a2b8;
-        }}
+        }
         
-        .methodology h4 {{
+        .methodology h4 {
             color: #17a2b8;
             margin-bottom: 15px;
-        }}
+        }
         
-        .timestamp {{
+        .timestamp {
             background: #fff3cd;
             border: 1px solid #ffeaa7;
             padding: 15px;
@@ -1006,34 +1087,128 @@ def generate_html_dashboard(df, suffix=""):
             margin-bottom: 20px;
             text-align: center;
             color: #856404;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 padding: 10px;
-            }}
+            }
             
-            header h1 {{
+            header h1 {
                 font-size: 2em;
-            }}
+            }
             
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
+            }
             
-            .nav-menu ul {{
+            .nav-menu ul {
                 flex-direction: column;
                 align-items: center;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <header>
+'''
+
+
+def compute_dashboard_metrics(df):
+    """
+    Compute the aggregate metrics consumed by generate_html_dashboard.
+
+    Split out so callers that build several dashboards (full dataset plus
+    regional subsets) can compute distributive aggregates once and reuse or
+    derive them, instead of re-scanning the frame per dashboard.
+    """
+    # Calculate key metrics from the data
+    cols = frozenset(df.columns)  # O(1) membership for the probes below
+    total_users = len(df)
+    unique_states = df['data.document.attributes.state'].nunique() if 'data.document.attributes.state' in cols else 0
+    unique_cities = df['data.document.attributes.city'].nunique() if 'data.document.attributes.city' in cols else 0
+    
+    # Calculate interest insights
+    interest_cols = [col for col in df.columns if 'interests.' in col and col not in ['data.document.attributes.interests.id', 'data.document.attributes.interests.created_at']]
+    total_interests = 0
+    high_value_interests = []
+    emerging_opportunities = []
+    mass_market_interests = []
+    
+    interest_analysis = _interest_stats(df, interest_cols)
+
+    total_interests = len(interest_analysis)
+    
+    if interest_analysis:
+        # High-value segments (high engagement + volume)
+        high_value_temp = sorted(interest_analysis.items(), 
+                                key=lambda x: x[1]['high_interest'] * x[1]['avg_score'], 
+                                reverse=True)[:3]
+        high_value_interests = high_value_temp
+        
+        # Emerging opportunities
+        emerging_temp = sorted([(k, v) for k, v in interest_analysis.items() if v['users'] >= 50 and v['avg_score'] >= 6], 
+                              key=lambda x: x[1]['avg_score'], reverse=True)[:3]
+        emerging_opportunities = emerging_temp
+        
+        # Mass market interests
+        mass_market_temp = sorted(interest_analysis.items(), key=lambda x: x[1]['users'], reverse=True)[:3]
+        mass_market_interests = mass_market_temp
+    
+    # Geographic insights
+    top_states = []
+    if 'data.document.attributes.state' in cols:
+        state_counts = _fast_value_counts(df['data.document.attributes.state']).head(3)
+        for state, count in state_counts.items():
+            pct = (count / total_users) * 100
+            top_states.append((state, count, pct))
+    
+    # Income insights
+    avg_income = 0
+    if 'data.document.attributes.family.estimated_income' in cols:
+        m = df['data.document.attributes.family.estimated_income'].mean()
+        # An all-null slice yields pd.NA under the pyarrow backend, which the
+        # avg_income > 0 checks downstream cannot truth-test
+        avg_income = float(m) if pd.notna(m) else 0
+
+    return {
+        'total_users': total_users,
+        'unique_states': unique_states,
+        'unique_cities': unique_cities,
+        'total_interests': total_interests,
+        'high_value_interests': high_value_interests,
+        'emerging_opportunities': emerging_opportunities,
+        'mass_market_interests': mass_market_interests,
+        'top_states': top_states,
+        'avg_income': avg_income,
+    }
+
+
+def generate_html_dashboard(df, suffix="", metrics=None, region=None):
+    """Generate HTML dashboard that combines all visualizations with dynamic content"""
+    print(f"Generating dynamic HTML dashboard{suffix}...")
+
+    if metrics is None:
+        metrics = compute_dashboard_metrics(df)
+    total_users = metrics['total_users']
+    unique_states = metrics['unique_states']
+    unique_cities = metrics['unique_cities']
+    total_interests = metrics['total_interests']
+    high_value_interests = metrics['high_value_interests']
+    emerging_opportunities = metrics['emerging_opportunities']
+    mass_market_interests = metrics['mass_market_interests']
+    top_states = metrics['top_states']
+    avg_income = metrics['avg_income']
+
+    # Generate current timestamp
+    from datetime import datetime
+    current_time = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+
+    parts = [_DASHBOARD_HEAD]
+    parts.append(f'''        <header>
             <h1>User Demographics & Behavior Analysis</h1>
             <p>Data-Driven Insights for Strategic Business Decisions</p>
-            <p style="font-size: 1em; margin-top: 10px; opacity: 0.8;">Based on {total_users:,} Data Axle enriched user records</p>
+{_region_banner(region)}            <p style="font-size: 1em; margin-top: 10px; opacity: 0.8;">Based on {total_users:,} Data Axle enriched user records</p>
             <p style="font-size: 0.9em; margin-top: 6px; opacity: 0.85;">Source: PostgreSQL table <code>matched_emails</code> (email, response_json) | Generated {current_time}</p>
         </header>
 
@@ -1084,26 +1259,26 @@ def generate_html_dashboard(df, suffix=""):
                     <div class="insight-card">
                         <h4>🎯 Key Takeaways</h4>
                         <ul>
-                            <li>Geographic presence across {unique_states} states and {unique_cities} cities</li>'''
+                            <li>Geographic presence across {unique_states} states and {unique_cities} cities</li>''')
     
     if avg_income > 0:
-        html_content += f'''
-                            <li>Average income: ${avg_income:,.0f} creates diverse segments</li>'''
+        parts.append(f'''
+                            <li>Average income: ${avg_income:,.0f} creates diverse segments</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                             <li>Rich interest data with {total_interests} categories analyzed</li>
                             <li>Strong engagement patterns across multiple interests</li>
                         </ul>
                     </div>
                     <div class="insight-card">
                         <h4>📈 Growth Opportunities</h4>
-                        <ul>'''
+                        <ul>''')
     
     if top_states:
-        html_content += f'''
-                            <li>Geographic expansion beyond top states: {', '.join([state for state, _, _ in top_states[:3]])}</li>'''
+        parts.append(f'''
+                            <li>Geographic expansion beyond top states: {', '.join([state for state, _, _ in top_states[:3]])}</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                             <li>Premium product offerings for high-income segments</li>
                             <li>Interest-based targeted marketing campaigns</li>
                             <li>Cross-selling opportunities between related interests</li>
@@ -1125,13 +1300,13 @@ def generate_html_dashboard(df, suffix=""):
                 <!-- <div class="insights-grid">
                     <div class="insight-card">
                         <h4>🏙️ Market Concentration</h4>
-                        <ul>'''
+                        <ul>''')
     
     for i, (state, count, pct) in enumerate(top_states):
-        html_content += f'''
-                            <li>{state}: {count:,} users ({pct:.1f}% of total)</li>'''
+        parts.append(f'''
+                            <li>{state}: {count:,} users ({pct:.1f}% of total)</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                         </ul>
                     </div>
                     <div class="insight-card">
@@ -1191,13 +1366,13 @@ def generate_html_dashboard(df, suffix=""):
                 <!-- <div class="insights-grid">
                     <div class="insight-card">
                         <h4>💵 Income Segments</h4>
-                        <ul>'''
+                        <ul>''')
     
     if avg_income > 0:
-        html_content += f'''
-                            <li>Average income: ${avg_income:,.0f}</li>'''
+        parts.append(f'''
+                            <li>Average income: ${avg_income:,.0f}</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                             <li>Wide income distribution creates multiple segments</li>
                             <li>Homeowners show higher average income</li>
                             <li>Premium offerings viable for high-income users</li>
@@ -1238,41 +1413,41 @@ def generate_html_dashboard(df, suffix=""):
                     <h3>🎯 Key Interest Insights</h3>
                     <div class="insights-columns">
                         <div class="insight-column">
-                            <h4>🔥 High-Value Segments</h4>'''
+                            <h4>🔥 High-Value Segments</h4>''')
     
     for interest, data in high_value_interests:
         engagement_rate = (data['high_interest'] / data['users']) * 100
-        html_content += f'''
+        parts.append(f'''
                             <div class="insight-item">
                                 <strong>{interest}:</strong> {data['high_interest']:,} highly engaged users ({engagement_rate:.1f}%)<br>
                                 Average score: {data['avg_score']:.1f}/9 | Total: {data['users']:,} users
-                            </div>'''
+                            </div>''')
     
-    html_content += f'''
+    parts.append(f'''
                         </div>
                         <div class="insight-column">
-                            <h4>🚀 Emerging Opportunities</h4>'''
+                            <h4>🚀 Emerging Opportunities</h4>''')
     
     for interest, data in emerging_opportunities:
-        html_content += f'''
+        parts.append(f'''
                             <div class="insight-item">
                                 <strong>{interest}:</strong> {data['avg_score']:.1f}/9 average score<br>
                                 {data['users']:,} users with high engagement potential
-                            </div>'''
+                            </div>''')
     
-    html_content += f'''
+    parts.append(f'''
                         </div>
                         <div class="insight-column">
-                            <h4>👥 Mass Market Appeal</h4>'''
+                            <h4>👥 Mass Market Appeal</h4>''')
     
     for interest, data in mass_market_interests:
-        html_content += f'''
+        parts.append(f'''
                             <div class="insight-item">
                                 <strong>{interest}:</strong> {data['users']:,} total users<br>
                                 Average engagement: {data['avg_score']:.1f}/9
-                            </div>'''
+                            </div>''')
     
-    html_content += f'''
+    parts.append(f'''
                         </div>
                     </div>
                 </div> -->
@@ -1280,22 +1455,22 @@ def generate_html_dashboard(df, suffix=""):
                 <!-- <div class="insights-grid">
                     <div class="insight-card">
                         <h4>🎯 Targeting Recommendations</h4>
-                        <ul>'''
+                        <ul>''')
     
     if high_value_interests:
         top_interest = high_value_interests[0][0]
-        html_content += f'''
-                            <li>Focus on {top_interest} interest users for core products</li>'''
+        parts.append(f'''
+                            <li>Focus on {top_interest} interest users for core products</li>''')
     
-    html_content += f'''
-                            <li>Develop premium offerings for high-intensity users (scores 7-9)</li>'''
+    parts.append(f'''
+                            <li>Develop premium offerings for high-intensity users (scores 7-9)</li>''')
     
     if emerging_opportunities:
         seasonal_interest = emerging_opportunities[0][0]
-        html_content += f'''
-                            <li>Create targeted campaigns around {seasonal_interest} interest</li>'''
+        parts.append(f'''
+                            <li>Create targeted campaigns around {seasonal_interest} interest</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                             <li>Build loyalty programs for top engagement categories</li>
                         </ul>
                     </div>
@@ -1324,31 +1499,31 @@ def generate_html_dashboard(df, suffix=""):
                         <ul>
                             <li>Implement intensity-based email segmentation</li>
                             <li>Create interest-specific landing pages</li>
-                            <li>Develop lookalike audiences based on high-intensity users</li>'''
+                            <li>Develop lookalike audiences based on high-intensity users</li>''')
     
     if top_states:
-        html_content += f'''
-                            <li>Launch geo-targeted campaigns in {top_states[0][0]} and other top states</li>'''
+        parts.append(f'''
+                            <li>Launch geo-targeted campaigns in {top_states[0][0]} and other top states</li>''')
     
     if emerging_opportunities:
-        html_content += f'''
-                            <li>Build seasonal campaigns around {emerging_opportunities[0][0]} and other high-intensity interests</li>'''
+        parts.append(f'''
+                            <li>Build seasonal campaigns around {emerging_opportunities[0][0]} and other high-intensity interests</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                         </ul>
                     </div>
                     <div class="insight-card">
                         <h4>🛍️ Product Development</h4>
-                        <ul>'''
+                        <ul>''')
     
     if high_value_interests:
-        html_content += f'''
-                            <li>Expand {high_value_interests[0][0].lower()}-oriented product lines</li>'''
+        parts.append(f'''
+                            <li>Expand {high_value_interests[0][0].lower()}-oriented product lines</li>''')
         if len(high_value_interests) > 1:
-            html_content += f'''
-                            <li>Develop premium {high_value_interests[1][0].lower()} collections</li>'''
+            parts.append(f'''
+                            <li>Develop premium {high_value_interests[1][0].lower()} collections</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                             <li>Create products targeting emerging high-intensity segments</li>
                             <li>Bundle related interest categories for increased value</li>
                             <li>Design offerings with broad demographic appeal</li>
@@ -1356,22 +1531,22 @@ def generate_html_dashboard(df, suffix=""):
                     </div>
                     <div class="insight-card">
                         <h4>💰 Revenue Optimization</h4>
-                        <ul>'''
+                        <ul>''')
     
     if avg_income > 0:
-        html_content += f'''
-                            <li>Implement tiered pricing (avg income: ${avg_income:,.0f})</li>'''
+        parts.append(f'''
+                            <li>Implement tiered pricing (avg income: ${avg_income:,.0f})</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                             <li>Offer premium subscriptions for high-intensity users</li>
                             <li>Create loyalty programs for top {len(high_value_interests)} interest categories</li>
-                            <li>Develop cross-selling strategies between related interests</li>'''
+                            <li>Develop cross-selling strategies between related interests</li>''')
     
     if top_states:
-        html_content += f'''
-                            <li>Focus ad spend on {len(top_states)} high-engagement geographic regions</li>'''
+        parts.append(f'''
+                            <li>Focus ad spend on {len(top_states)} high-engagement geographic regions</li>''')
     
-    html_content += f'''
+    parts.append(f'''
                         </ul>
                     </div>
                     <div class="insight-card">
@@ -1396,13 +1571,14 @@ def generate_html_dashboard(df, suffix=""):
         </footer> -->
     </div>
 </body>
-</html>'''
+</html>''')
     
-    # Write the HTML file
+    # Write the HTML file incrementally instead of joining one giant string
     html_filename = f'user_dashboard{suffix}.html'
-    with open(html_filename, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
+    with open(html_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for part in parts:
+            f.write(part)
+
     print(f"✅ Dynamic HTML dashboard generated: {html_filename}")
     print("📱 Open this file in any web browser to view the complete dashboard")
     print("🔄 Dashboard content reflects current data and can be regenerated anytime")
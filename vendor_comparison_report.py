@@ -6,8 +6,14 @@ Output: vendor_comparison_<store_suffix>.html
 """
 
 import argparse
+import hashlib
 import os
 import re
+import string
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 try:
@@ -20,12 +26,14 @@ import pandas as pd
 import numpy as np
 
 try:
-    from postgres_loader import load_from_postgres as load_data_axle
+    from postgres_loader import HOT_PATHS as DA_HOT_PATHS, load_from_postgres as load_data_axle
 except ImportError:
+    DA_HOT_PATHS = None
     load_data_axle = None
 try:
-    from fullcontact_loader import load_from_postgres as load_fullcontact
+    from fullcontact_loader import HOT_PATHS as FC_HOT_PATHS, load_from_postgres as load_fullcontact
 except ImportError:
+    FC_HOT_PATHS = None
     load_fullcontact = None
 
 # Column names
@@ -48,6 +56,11 @@ FC = {
 }
 
 
+# One slot-sized record per anomaly instead of a keyed dict; severities are
+# interned so every "high"/"medium" shares one string object
+Anomaly = namedtuple("Anomaly", "metric detail severity")
+
+
 def _col(df, candidates):
     for c in candidates:
         if c in df.columns:
@@ -69,6 +82,145 @@ def _pct(part, whole):
     return 100.0 * part / whole
 
 
+_CACHE_DIR = ".cache"
+_CACHE_TTL_S = 3600  # re-query Postgres after an hour
+
+
+def _cached_load(loader, table, store_id, **kwargs):
+    """Load via loader, backed by a Parquet disk cache per (table, store).
+
+    Parquet reloads are columnar and skip the JSON parse/flatten entirely, so
+    repeat reports against an unchanged table cost one file read. Stale or
+    unwritable cache entries fall back to the live query.
+    """
+    key = hashlib.md5(f"{table}|{store_id}".encode()).hexdigest()
+    path = os.path.join(_CACHE_DIR, f"{key}.parquet")
+    try:
+        if time.time() - os.path.getmtime(path) < _CACHE_TTL_S:
+            df = pd.read_parquet(path)
+            print(f"✅ Cache hit: {table} / {store_id} ({len(df):,} rows from {path})")
+            return df
+    except OSError:
+        pass
+    df = loader(table=table, store_filter=store_id, **kwargs)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        df.to_parquet(path, compression="zstd")
+    except (OSError, ValueError, ImportError) as exc:
+        print(f"⚠️ Could not write parquet cache {path}: {exc}")
+    return df
+
+
+# Compiled once at import; substitution is a single pass over the page
+# skeleton instead of re-interpolating the whole f-string per report
+_HTML_TMPL = string.Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Vendor Comparison: Data Axle vs FullContact — ${store_id}</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: #f5f5f5; color: #222; padding: 24px; }
+        .container { max-width: 1000px; margin: 0 auto; }
+        h1 { margin-bottom: 8px; color: #1a1a2e; }
+        .subtitle { color: #666; margin-bottom: 24px; }
+        section { background: #fff; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.08); padding: 24px; margin-bottom: 24px; }
+        section h2 { margin-bottom: 16px; color: #16213e; font-size: 1.25rem; border-bottom: 2px solid #e0e0e0; padding-bottom: 8px; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { text-align: left; padding: 10px 12px; border-bottom: 1px solid #eee; }
+        th { background: #f8f9fa; font-weight: 600; }
+        td:first-child { width: 28%; }
+        tr.anomaly { background: #fff8e6; }
+        .anomaly-box { background: #fff3cd; border: 1px solid #ffc107; border-radius: 8px; padding: 16px; margin-bottom: 16px; }
+        .anomaly-box h3 { margin-bottom: 12px; color: #856404; }
+        .anomaly.high { color: #b71c1c; }
+        .anomaly.medium { color: #e65100; }
+        .metric { font-size: 1.1rem; margin-bottom: 8px; }
+        .metric strong { color: #0d47a1; }
+        .two-col { display: grid; grid-template-columns: 1fr 1fr; gap: 24px; }
+        @media (max-width: 700px) { .two-col { grid-template-columns: 1fr; } }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Vendor Comparison: Data Axle vs FullContact</h1>
+        <p class="subtitle">Store: <strong>${store_id}</strong> (Smarty SwimOutlet conversion) · Generated ${generated}</p>
+        <p class="subtitle">Compare: <code>user_dashboard_smarty_swimoutlet_412.html</code> (Data Axle) vs <code>fullcontact_user_dashboard.html</code> / <code>fullcontact_user_dashboard_smarty_swimoutlet_412.html</code> (FullContact)</p>
+
+        <section>
+            <h2>Record counts & email overlap</h2>
+            <div class="two-col">
+                <div>
+                    <p class="metric"><strong>Data Axle</strong> (matched_emails): ${n_da} records</p>
+                    <p class="metric"><strong>FullContact</strong> (fullcontact_matches): ${n_fc} records</p>
+                </div>
+                <div>
+                    <p class="metric"><strong>Emails in both</strong>: ${n_overlap}</p>
+                    <p class="metric"><strong>Only in Data Axle</strong>: ${n_only_da}</p>
+                    <p class="metric"><strong>Only in FullContact</strong>: ${n_only_fc}</p>
+                    <p class="metric"><strong>Union (unique emails)</strong>: ${n_union}</p>
+                </div>
+            </div>
+        </section>
+
+        <section>
+            <h2>Anomalies & differences</h2>
+            <p style="margin-bottom: 12px;">These metrics differ meaningfully between vendors (coverage, schema, or enrichment timing).</p>
+            <div class="anomaly-box">
+                ${anomaly_box}
+            </div>
+        </section>
+
+        <section>
+            <h2>Gender distribution</h2>
+            <table>
+                <thead><tr><th>Gender</th><th>Data Axle</th><th>FullContact</th></tr></thead>
+                <tbody>${gender_rows}</tbody>
+            </table>
+        </section>
+
+        <section>
+            <h2>Top states / regions</h2>
+            <table>
+                <thead><tr><th>State/Region</th><th>Data Axle</th><th>FullContact</th></tr></thead>
+                <tbody>${state_rows}</tbody>
+            </table>
+        </section>
+
+        <section>
+            <h2>Top cities</h2>
+            <table>
+                <thead><tr><th>City</th><th>Data Axle</th><th>FullContact</th></tr></thead>
+                <tbody>${city_rows}</tbody>
+            </table>
+        </section>
+
+        <section>
+            <h2>Income / financial</h2>
+            <table>
+                <thead><tr><th>Metric</th><th>Data Axle</th><th>FullContact</th></tr></thead>
+                <tbody>
+                    <tr><td>Income</td><td>${income_da_str}</td><td>${income_fc_str}</td></tr>
+                </tbody>
+            </table>
+            <p style="margin-top: 12px; font-size: 0.9rem; color: #666;">Data Axle: numeric estimated_income. FullContact: bucket labels (e.g. $$75,000 - $$99,999). Direct comparison is approximate.</p>
+        </section>
+
+        <section>
+            <h2>How to use this report</h2>
+            <ul style="line-height: 1.8;">
+                <li><strong>Record count mismatch</strong>: Different tables or enrichment pipelines may include/exclude users (e.g. no match in one vendor).</li>
+                <li><strong>Gender/geo differences</strong>: Different sources and refresh dates; FullContact uses household/location data, Data Axle uses its own attributes.</li>
+                <li><strong>Income</strong>: Data Axle = modeled income; FullContact = self-reported or household finance buckets — not directly comparable.</li>
+                <li>For a single source of truth, pick one vendor per use case or reconcile on email overlap and flag conflicts.</li>
+            </ul>
+        </section>
+    </div>
+</body>
+</html>""")
+
+
 def run_comparison(store_id: str, connection_string: str, out_path: str = None):
     store_suffix = "".join(c for c in str(store_id) if c.isalnum() or c in " _-").replace(" ", "").replace("-", "_") or "store"
     out_path = out_path or f"vendor_comparison_{store_suffix}.html"
@@ -76,36 +228,51 @@ def run_comparison(store_id: str, connection_string: str, out_path: str = None):
     if load_data_axle is None or load_fullcontact is None:
         raise SystemExit("Need postgres_loader and fullcontact_loader (pip install psycopg2-binary)")
 
-    print(f"Loading Data Axle (matched_emails, store={store_id})...")
-    df_da = load_data_axle(
-        connection_string=connection_string,
-        table="matched_emails",
-        email_column="email",
-        data_column="response_json",
-        store_column="external_store_id",
-    )
-    df_da = df_da[df_da["external_store_id"] == store_id].copy()
+    # The two vendor loads are independent query+flatten pipelines; psycopg2
+    # releases the GIL on network I/O, so run them on two threads
+    print(f"Loading Data Axle (matched_emails) and FullContact (fullcontact_matches), store={store_id}...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_da = executor.submit(
+            _cached_load,
+            load_data_axle,
+            "matched_emails",
+            store_id,
+            connection_string=connection_string,
+            email_column="email",
+            data_column="response_json",
+            store_column="external_store_id",
+            paths=DA_HOT_PATHS,
+        )
+        future_fc = executor.submit(
+            _cached_load,
+            load_fullcontact,
+            "fullcontact_matches",
+            store_id,
+            connection_string=connection_string,
+            email_column="email",
+            data_column="response_json",
+            store_column="external_store_id",
+            paths=FC_HOT_PATHS,
+        )
+        df_da = future_da.result()
+        df_fc = future_fc.result()
     n_da = len(df_da)
-
-    print(f"Loading FullContact (fullcontact_matches, store={store_id})...")
-    df_fc = load_fullcontact(
-        connection_string=connection_string,
-        table="fullcontact_matches",
-        email_column="email",
-        data_column="response_json",
-        store_column="external_store_id",
-    )
-    df_fc = df_fc[df_fc["external_store_id"] == store_id].copy()
     n_fc = len(df_fc)
 
-    emails_da = set(df_da["email"].dropna().astype(str).str.strip().tolist())
-    emails_fc = set(df_fc["email"].dropna().astype(str).str.strip().tolist())
-    emails_da.discard("")
-    emails_fc.discard("")
-    overlap = emails_da & emails_fc
-    only_da = emails_da - emails_fc
-    only_fc = emails_fc - emails_da
-    union = emails_da | emails_fc
+    def _email_hashes(df):
+        # Hash each cleaned email once to an int64; the overlap/difference
+        # counts then come from numpy set ops over contiguous integer
+        # buffers instead of re-hashing Python strings per set operation
+        s = df["email"].dropna().astype("string").str.strip()
+        s = s[s != ""]
+        return np.unique(pd.util.hash_pandas_object(s, index=False).to_numpy())
+
+    h_da = _email_hashes(df_da)
+    h_fc = _email_hashes(df_fc)
+    n_overlap = int(np.intersect1d(h_da, h_fc, assume_unique=True).size)
+    n_only_da = int(h_da.size) - n_overlap
+    n_only_fc = int(h_fc.size) - n_overlap
+    n_union = int(h_da.size) + int(h_fc.size) - n_overlap
 
     # Metrics
     da_gender_col = _col(df_da, [DA["gender"]])
@@ -117,19 +284,18 @@ def run_comparison(store_id: str, connection_string: str, out_path: str = None):
     da_income_col = _col(df_da, [DA["income"]])
     fc_income_col = _col(df_fc, [FC["income"]]) or next((c for c in df_fc.columns if "household.finance.income" in c), None)
 
-    # Distributions (normalize gender: M/Male, F/Female for comparison)
-    def _normalize_gender(s):
-        if pd.isna(s) or not str(s).strip():
-            return None
-        x = str(s).strip().lower()
-        if x in ("m", "male"):
-            return "Male"
-        if x in ("f", "female"):
-            return "Female"
-        return s
-
-    da_gender_series = df_da[da_gender_col].map(_normalize_gender) if da_gender_col and da_gender_col in df_da.columns else None
-    fc_gender_series = df_fc[fc_gender_col].map(_normalize_gender) if fc_gender_col and fc_gender_col in df_fc.columns else None
+    # Distributions (normalize gender: M/Male, F/Female for comparison).
+    # String ops and the dict map run in C over the whole column; no
+    # per-row Python function frames.
+    _GENDER_MAP = {"m": "Male", "male": "Male", "f": "Female", "female": "Female"}
+
+    def _normalize_gender(series):
+        s = series.astype("string").str.strip()
+        s = s.mask(s == "")
+        return s.str.lower().map(_GENDER_MAP).fillna(s)
+
+    da_gender_series = _normalize_gender(df_da[da_gender_col]) if da_gender_col else None
+    fc_gender_series = _normalize_gender(df_fc[fc_gender_col]) if fc_gender_col else None
     da_gender = _safe_value_counts(da_gender_series)
     fc_gender = _safe_value_counts(fc_gender_series)
     da_state = _safe_value_counts(df_da[da_state_col] if da_state_col else None, 10)
@@ -147,36 +313,37 @@ def run_comparison(store_id: str, connection_string: str, out_path: str = None):
     anomalies = []
 
     if n_da != n_fc:
-        anomalies.append({
-            "metric": "Record count",
-            "detail": f"Data Axle: {n_da:,} | FullContact: {n_fc:,} | Difference: {abs(n_da - n_fc):,}",
-            "severity": "high" if abs(n_da - n_fc) > max(n_da, n_fc) * 0.1 else "medium",
-        })
-    if len(only_fc) > 0:
-        anomalies.append({
-            "metric": "Emails only in FullContact",
-            "detail": f"{len(only_fc):,} emails have FullContact data but no Data Axle match (possible enrichment gap or different feed)",
-            "severity": "medium",
-        })
-    if len(only_da) > 0:
-        anomalies.append({
-            "metric": "Emails only in Data Axle",
-            "detail": f"{len(only_da):,} emails have Data Axle data but no FullContact match",
-            "severity": "medium",
-        })
-
-    # Gender comparison
+        anomalies.append(Anomaly(
+            "Record count",
+            f"Data Axle: {n_da:,} | FullContact: {n_fc:,} | Difference: {abs(n_da - n_fc):,}",
+            sys.intern("high" if abs(n_da - n_fc) > max(n_da, n_fc) * 0.1 else "medium"),
+        ))
+    if n_only_fc > 0:
+        anomalies.append(Anomaly(
+            "Emails only in FullContact",
+            f"{n_only_fc:,} emails have FullContact data but no Data Axle match (possible enrichment gap or different feed)",
+            sys.intern("medium"),
+        ))
+    if n_only_da > 0:
+        anomalies.append(Anomaly(
+            "Emails only in Data Axle",
+            f"{n_only_da:,} emails have Data Axle data but no FullContact match",
+            sys.intern("medium"),
+        ))
+
+    # Gender comparison: pivot both counts side by side, compute the
+    # percentage gap in one array op, and only iterate the flagged rows
     if not da_gender.empty and not fc_gender.empty:
-        for g in set(da_gender.index) | set(fc_gender.index):
-            pct_da = _pct(da_gender.get(g, 0), n_da)
-            pct_fc = _pct(fc_gender.get(g, 0), n_fc)
-            diff = abs(pct_da - pct_fc)
-            if diff >= 5.0:
-                anomalies.append({
-                    "metric": f"Gender ({g})",
-                    "detail": f"Data Axle: {pct_da:.1f}% | FullContact: {pct_fc:.1f}% | Δ {diff:.1f}pp",
-                    "severity": "high" if diff >= 10 else "medium",
-                })
+        both = pd.concat([da_gender.rename("da"), fc_gender.rename("fc")], axis=1).fillna(0)
+        both["pct_da"] = 100.0 * both["da"] / max(n_da, 1)
+        both["pct_fc"] = 100.0 * both["fc"] / max(n_fc, 1)
+        both["diff"] = (both["pct_da"] - both["pct_fc"]).abs()
+        for g, r in both[both["diff"] >= 5.0].iterrows():
+            anomalies.append(Anomaly(
+                f"Gender ({g})",
+                f"Data Axle: {r['pct_da']:.1f}% | FullContact: {r['pct_fc']:.1f}% | Δ {r['diff']:.1f}pp",
+                sys.intern("high" if r["diff"] >= 10 else "medium"),
+            ))
 
     # Top state
     if not da_state.empty and not fc_state.empty:
@@ -185,11 +352,11 @@ def run_comparison(store_id: str, connection_string: str, out_path: str = None):
         if top_da != top_fc:
             pct_da = _pct(da_state.iloc[0], n_da)
             pct_fc = _pct(fc_state.iloc[0], n_fc)
-            anomalies.append({
-                "metric": "Top state/region",
-                "detail": f"Data Axle top: {top_da} ({pct_da:.1f}%) | FullContact top: {top_fc} ({pct_fc:.1f}%)",
-                "severity": "medium",
-            })
+            anomalies.append(Anomaly(
+                "Top state/region",
+                f"Data Axle top: {top_da} ({pct_da:.1f}%) | FullContact top: {top_fc} ({pct_fc:.1f}%)",
+                sys.intern("medium"),
+            ))
 
     # Build HTML
     def row(label, da_val, fc_val, anomaly=False):
@@ -199,27 +366,32 @@ def run_comparison(store_id: str, connection_string: str, out_path: str = None):
             <td>{fc_val}</td>
         </tr>"""
 
-    gender_rows = ""
+    # Collect rows in lists and join once: O(N) instead of quadratic
+    # string reallocation from repeated +=
+    gender_row_parts = []
     for g in sorted(set(da_gender.index.tolist() + fc_gender.index.tolist())):
         c_da = da_gender.get(g, 0)
         c_fc = fc_gender.get(g, 0)
         p_da = _pct(c_da, n_da)
         p_fc = _pct(c_fc, n_fc)
-        gender_rows += row(g, f"{c_da:,} ({p_da:.1f}%)", f"{c_fc:,} ({p_fc:.1f}%)", abs(p_da - p_fc) >= 5)
+        gender_row_parts.append(row(g, f"{c_da:,} ({p_da:.1f}%)", f"{c_fc:,} ({p_fc:.1f}%)", abs(p_da - p_fc) >= 5))
+    gender_rows = "".join(gender_row_parts)
 
     all_states = sorted(set(list(da_state.index)[:15]) | set(list(fc_state.index)[:15]))
-    state_rows = ""
+    state_row_parts = []
     for s in all_states:
         c_da = da_state.get(s, 0)
         c_fc = fc_state.get(s, 0)
-        state_rows += row(s, f"{c_da:,}" if c_da else "—", f"{c_fc:,}" if c_fc else "—", c_da != c_fc)
+        state_row_parts.append(row(s, f"{c_da:,}" if c_da else "—", f"{c_fc:,}" if c_fc else "—", c_da != c_fc))
+    state_rows = "".join(state_row_parts)
 
     all_cities = sorted(set(list(da_city.index)[:15]) | set(list(fc_city.index)[:15]))
-    city_rows = ""
+    city_row_parts = []
     for c in all_cities:
         ct_da = da_city.get(c, 0)
         ct_fc = fc_city.get(c, 0)
-        city_rows += row(c, f"{ct_da:,}" if ct_da else "—", f"{ct_fc:,}" if ct_fc else "—", ct_da != ct_fc)
+        city_row_parts.append(row(c, f"{ct_da:,}" if ct_da else "—", f"{ct_fc:,}" if ct_fc else "—", ct_da != ct_fc))
+    city_rows = "".join(city_row_parts)
 
     income_da_str = "—"
     if da_income_vals is not None and len(da_income_vals) > 0:
@@ -229,116 +401,26 @@ def run_comparison(store_id: str, connection_string: str, out_path: str = None):
         income_fc_str = " | ".join([f"{idx}: {v:,}" for idx, v in fc_income_vals.head(5).items()])
 
     anomaly_rows = "".join(
-        f'<div class="anomaly {a["severity"]}"><strong>{a["metric"]}</strong>: {a["detail"]}</div>'
+        f'<div class="anomaly {a.severity}"><strong>{a.metric}</strong>: {a.detail}</div>'
         for a in anomalies
     )
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Vendor Comparison: Data Axle vs FullContact — {store_id}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: #f5f5f5; color: #222; padding: 24px; }}
-        .container {{ max-width: 1000px; margin: 0 auto; }}
-        h1 {{ margin-bottom: 8px; color: #1a1a2e; }}
-        .subtitle {{ color: #666; margin-bottom: 24px; }}
-        section {{ background: #fff; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.08); padding: 24px; margin-bottom: 24px; }}
-        section h2 {{ margin-bottom: 16px; color: #16213e; font-size: 1.25rem; border-bottom: 2px solid #e0e0e0; padding-bottom: 8px; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ text-align: left; padding: 10px 12px; border-bottom: 1px solid #eee; }}
-        th {{ background: #f8f9fa; font-weight: 600; }}
-        td:first-child {{ width: 28%; }}
-        tr.anomaly {{ background: #fff8e6; }}
-        .anomaly-box {{ background: #fff3cd; border: 1px solid #ffc107; border-radius: 8px; padding: 16px; margin-bottom: 16px; }}
-        .anomaly-box h3 {{ margin-bottom: 12px; color: #856404; }}
-        .anomaly.high {{ color: #b71c1c; }}
-        .anomaly.medium {{ color: #e65100; }}
-        .metric {{ font-size: 1.1rem; margin-bottom: 8px; }}
-        .metric strong {{ color: #0d47a1; }}
-        .two-col {{ display: grid; grid-template-columns: 1fr 1fr; gap: 24px; }}
-        @media (max-width: 700px) {{ .two-col {{ grid-template-columns: 1fr; }} }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Vendor Comparison: Data Axle vs FullContact</h1>
-        <p class="subtitle">Store: <strong>{store_id}</strong> (Smarty SwimOutlet conversion) · Generated {datetime.now().strftime("%B %d, %Y %H:%M")}</p>
-        <p class="subtitle">Compare: <code>user_dashboard_smarty_swimoutlet_412.html</code> (Data Axle) vs <code>fullcontact_user_dashboard.html</code> / <code>fullcontact_user_dashboard_smarty_swimoutlet_412.html</code> (FullContact)</p>
-
-        <section>
-            <h2>Record counts & email overlap</h2>
-            <div class="two-col">
-                <div>
-                    <p class="metric"><strong>Data Axle</strong> (matched_emails): {n_da:,} records</p>
-                    <p class="metric"><strong>FullContact</strong> (fullcontact_matches): {n_fc:,} records</p>
-                </div>
-                <div>
-                    <p class="metric"><strong>Emails in both</strong>: {len(overlap):,}</p>
-                    <p class="metric"><strong>Only in Data Axle</strong>: {len(only_da):,}</p>
-                    <p class="metric"><strong>Only in FullContact</strong>: {len(only_fc):,}</p>
-                    <p class="metric"><strong>Union (unique emails)</strong>: {len(union):,}</p>
-                </div>
-            </div>
-        </section>
-
-        <section>
-            <h2>Anomalies & differences</h2>
-            <p style="margin-bottom: 12px;">These metrics differ meaningfully between vendors (coverage, schema, or enrichment timing).</p>
-            <div class="anomaly-box">
-                {anomaly_rows if anomalies else '<p>No major anomalies detected; distributions are in line.</p>'}
-            </div>
-        </section>
-
-        <section>
-            <h2>Gender distribution</h2>
-            <table>
-                <thead><tr><th>Gender</th><th>Data Axle</th><th>FullContact</th></tr></thead>
-                <tbody>{gender_rows}</tbody>
-            </table>
-        </section>
-
-        <section>
-            <h2>Top states / regions</h2>
-            <table>
-                <thead><tr><th>State/Region</th><th>Data Axle</th><th>FullContact</th></tr></thead>
-                <tbody>{state_rows or '<tr><td colspan="3">No state data</td></tr>'}</tbody>
-            </table>
-        </section>
-
-        <section>
-            <h2>Top cities</h2>
-            <table>
-                <thead><tr><th>City</th><th>Data Axle</th><th>FullContact</th></tr></thead>
-                <tbody>{city_rows or '<tr><td colspan="3">No city data</td></tr>'}</tbody>
-            </table>
-        </section>
-
-        <section>
-            <h2>Income / financial</h2>
-            <table>
-                <thead><tr><th>Metric</th><th>Data Axle</th><th>FullContact</th></tr></thead>
-                <tbody>
-                    <tr><td>Income</td><td>{income_da_str}</td><td>{income_fc_str}</td></tr>
-                </tbody>
-            </table>
-            <p style="margin-top: 12px; font-size: 0.9rem; color: #666;">Data Axle: numeric estimated_income. FullContact: bucket labels (e.g. $75,000 - $99,999). Direct comparison is approximate.</p>
-        </section>
-
-        <section>
-            <h2>How to use this report</h2>
-            <ul style="line-height: 1.8;">
-                <li><strong>Record count mismatch</strong>: Different tables or enrichment pipelines may include/exclude users (e.g. no match in one vendor).</li>
-                <li><strong>Gender/geo differences</strong>: Different sources and refresh dates; FullContact uses household/location data, Data Axle uses its own attributes.</li>
-                <li><strong>Income</strong>: Data Axle = modeled income; FullContact = self-reported or household finance buckets — not directly comparable.</li>
-                <li>For a single source of truth, pick one vendor per use case or reconcile on email overlap and flag conflicts.</li>
-            </ul>
-        </section>
-    </div>
-</body>
-</html>"""
+    html = _HTML_TMPL.substitute(
+        store_id=store_id,
+        generated=datetime.now().strftime("%B %d, %Y %H:%M"),
+        n_da=f"{n_da:,}",
+        n_fc=f"{n_fc:,}",
+        n_overlap=f"{n_overlap:,}",
+        n_only_da=f"{n_only_da:,}",
+        n_only_fc=f"{n_only_fc:,}",
+        n_union=f"{n_union:,}",
+        anomaly_box=anomaly_rows if anomalies else "<p>No major anomalies detected; distributions are in line.</p>",
+        gender_rows=gender_rows,
+        state_rows=state_rows or '<tr><td colspan="3">No state data</td></tr>',
+        city_rows=city_rows or '<tr><td colspan="3">No city data</td></tr>',
+        income_da_str=income_da_str,
+        income_fc_str=income_fc_str,
+    )
 
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(html)